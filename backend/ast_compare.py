@@ -1,5 +1,8 @@
-from copy import deepcopy
+from copy import copy
 from .parser import parse_code  
+from .clones import find_clones
+from .token_compare import compare_tokens
+from .traversal import postorder, subtree_sizes
 
 class ASTNormalizer:
     def __init__(self):
@@ -10,10 +13,29 @@ class ASTNormalizer:
         if node is None:
             return None
         
-        # Create a deep copy to avoid modifying the original AST
-        normalized_node = deepcopy(node)
+        # Build a normalized copy so the original AST is left untouched.
+        # Nodes are visited in preorder with an explicit stack; each entry
+        # carries the children list of the parent copy it belongs to.
+        root = []
+        stack = [(node, root)]
+        while stack:
+            source, siblings = stack.pop()
+            if source is None:
+                siblings.append(None)
+                continue
+            
+            normalized_node = copy(source)
+            self.normalize_value(normalized_node)
+            normalized_node.children = []
+            siblings.append(normalized_node)
+            
+            for child in reversed(source.children):
+                stack.append((child, normalized_node.children))
         
-        # Normalize based on node type
+        return root[0]
+
+    def normalize_value(self, normalized_node):
+        """Normalize the value of a single node in place"""
         if normalized_node.type == 'identifier':
             if normalized_node.value not in self.var_map:
                 self.var_map[normalized_node.value] = f'var{self.var_counter}'
@@ -27,66 +49,94 @@ class ASTNormalizer:
                 normalized_node.value = 0.0
             else:
                 normalized_node.value = ""
-        
-        # Recursively normalize children
-        normalized_node.children = [self.normalize(child) for child in normalized_node.children]
-        
-        return normalized_node
 
 def subtree_size(node):
     """Calculate the size of a subtree (number of nodes)"""
     if node is None:
         return 0
-    return 1 + sum(subtree_size(child) for child in node.children)
+    return len(postorder(node))
+
+def tree_edit_distance(node1, node2, memo=None, sizes=None, hashes=None):
+    """Calculate the tree edit distance between two ASTs with memoization
 
-def tree_edit_distance(node1, node2, memo=None):
-    """Calculate the tree edit distance between two ASTs with memoization"""
+    ``hashes`` optionally maps id(node) to a structural hash of the normalized
+    subtree; pairs with equal hashes are identical and cost nothing.
+    """
     if memo is None:
         memo = {}
+    if sizes is None:
+        sizes = subtree_sizes(node1, node2)
+    if hashes is None:
+        hashes = {}
     
-    # Create a key for memoization (using object ids)
-    key = (id(node1) if node1 else None, id(node2) if node2 else None)
-    if key in memo:
-        return memo[key]
-    
-    if node1 is None and node2 is None:
-        result = 0
-    elif node1 is None:
-        result = subtree_size(node2)
-    elif node2 is None:
-        result = subtree_size(node1)
-    elif node1.type != node2.type or node1.value != node2.value:
-        # If nodes are different, cost is 1 + optimal alignment of children
-        result = 1 + min_children_distance(node1.children, node2.children, memo)
-    else:
-        # Nodes are the same, just align children
-        result = min_children_distance(node1.children, node2.children, memo)
+    # Pairs are resolved in postorder: a pair is expanded once to schedule
+    # its child pairs, then finished once all of those are in the memo.
+    stack = [(node1, node2, False)]
+    while stack:
+        a, b, expanded = stack.pop()
+        # Create a key for memoization (using object ids)
+        key = (id(a) if a else None, id(b) if b else None)
+        if key in memo:
+            continue
+        
+        if a is None and b is None:
+            memo[key] = 0
+        elif a is None:
+            memo[key] = sizes.get(id(b)) or subtree_size(b)
+        elif b is None:
+            memo[key] = sizes.get(id(a)) or subtree_size(a)
+        elif id(a) in hashes and hashes[id(a)] == hashes.get(id(b)):
+            memo[key] = 0
+        elif not expanded:
+            stack.append((a, b, True))
+            for child1 in a.children:
+                for child2 in b.children:
+                    stack.append((child1, child2, False))
+        else:
+            # Cost is 1 if the nodes differ, plus optimal alignment of children
+            result = align_children(a.children, b.children, memo, sizes)
+            if a.type != b.type or a.value != b.value:
+                result += 1
+            memo[key] = result
     
-    memo[key] = result
-    return result
+    return memo[(id(node1) if node1 else None, id(node2) if node2 else None)]
 
-def min_children_distance(children1, children2, memo):
+def min_children_distance(children1, children2, memo, sizes=None):
     """Find minimum distance to align two lists of children using DP"""
+    if sizes is None:
+        sizes = subtree_sizes(*children1, *children2)
+    for child1 in children1:
+        for child2 in children2:
+            tree_edit_distance(child1, child2, memo, sizes)
+    return align_children(children1, children2, memo, sizes)
+
+def align_children(children1, children2, memo, sizes):
+    """Run the alignment DP once every child pair distance is in the memo"""
     len1, len2 = len(children1), len(children2)
+    size1 = [sizes.get(id(child), 0) if child is not None else 0 for child in children1]
+    size2 = [sizes.get(id(child), 0) if child is not None else 0 for child in children2]
     
     # DP table
     dp = [[0] * (len2 + 1) for _ in range(len1 + 1)]
     
     # Initialize base cases
-    for i in range(len1 + 1):
-        dp[i][0] = sum(subtree_size(children1[j]) for j in range(i))
-    for j in range(len2 + 1):
-        dp[0][j] = sum(subtree_size(children2[j]) for j in range(j))
+    for i in range(1, len1 + 1):
+        dp[i][0] = dp[i-1][0] + size1[i-1]
+    for j in range(1, len2 + 1):
+        dp[0][j] = dp[0][j-1] + size2[j-1]
     
     # Fill DP table
     for i in range(1, len1 + 1):
+        child1 = children1[i-1]
+        id1 = id(child1) if child1 else None
         for j in range(1, len2 + 1):
+            child2 = children2[j-1]
             # Cost of aligning children1[i-1] with children2[j-1]
-            align_cost = tree_edit_distance(children1[i-1], children2[j-1], memo)
+            align_cost = memo[(id1, id(child2) if child2 else None)]
             
             dp[i][j] = min(
-                dp[i-1][j] + subtree_size(children1[i-1]),  # delete children1[i-1]
-                dp[i][j-1] + subtree_size(children2[j-1]),  # insert children2[j-1]
+                dp[i-1][j] + size1[i-1],  # delete children1[i-1]
+                dp[i][j-1] + size2[j-1],  # insert children2[j-1]
                 dp[i-1][j-1] + align_cost  # align children1[i-1] with children2[j-1]
             )
     
@@ -115,15 +165,39 @@ def calculate_similarity(ast1, ast2):
     # Calculate tree edit distance
     distance = tree_edit_distance(normalized_ast1, normalized_ast2)
     
+    return similarity_score(distance, size1, size2)
+
+def similarity_score(distance, size1, size2):
+    """Turn a tree edit distance into a similarity percentage"""
+    if size1 == 0 or size2 == 0:
+        return 0.0
+    
     # Use correct similarity formula
     max_size = max(size1, size2)
     similarity = (1 - distance / max_size) * 100
     
     return max(0.0, min(100.0, similarity))  # Clamp between 0 and 100
 
-def compare_code(code1, code2):
-    """Compare two code snippets and return similarity score"""
+def compare_code(code1, code2, mode='ast'):
+    """Compare two code snippets and return similarity score
+
+    ``mode`` selects the engine: 'ast' for tree edit distance over normalized
+    ASTs, or 'tokens' for Greedy String Tiling over normalized tokens.
+    """
     try:
+        if mode == 'tokens':
+            result = compare_tokens(code1, code2)
+            return {
+                'similarity': result['similarity'],
+                'mode': mode,
+                'ast1': None,
+                'ast2': None,
+                'clones': [],
+                'tiles': result['tiles']
+            }
+        if mode != 'ast':
+            raise ValueError(f"Unknown comparison mode '{mode}'")
+        
         # Parse both code snippets
         ast1 = parse_code(code1)
         ast2 = parse_code(code2)
@@ -133,8 +207,11 @@ def compare_code(code1, code2):
         
         return {
             'similarity': similarity,
+            'mode': mode,
             'ast1': ast1,
-            'ast2': ast2
+            'ast2': ast2,
+            'clones': find_clones(ast1, ast2),
+            'tiles': []
         }
     except Exception as e:
         print(f"Error comparing code: {e}")
@@ -142,5 +219,7 @@ def compare_code(code1, code2):
             'similarity': 0.0,
             'ast1': None,
             'ast2': None,
+            'clones': [],
+            'tiles': [],
             'error': str(e)
         }
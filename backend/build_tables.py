@@ -0,0 +1,34 @@
+"""Generate the PLY lexer and parser tables shipped with the backend.
+
+Run this whenever the token rules or grammar change:
+
+    python -m backend.build_tables
+"""
+import os
+import sys
+
+import ply.lex as lex
+import ply.yacc as yacc
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+TABLE_MODULES = ('lextab', 'parsetab')
+
+
+def build_tables(outputdir=BACKEND_DIR):
+    """Remove stale tables and write fresh lextab.py and parsetab.py"""
+    for name in TABLE_MODULES:
+        path = os.path.join(outputdir, f"{name}.py")
+        if os.path.exists(path):
+            os.remove(path)
+        sys.modules.pop(f"backend.{name}", None)
+
+    from . import lexer, parser
+
+    lex.lex(module=lexer, optimize=1, lextab='backend.lextab', outputdir=outputdir)
+    yacc.yacc(module=parser, debug=False, write_tables=True,
+              tabmodule='backend.parsetab', outputdir=outputdir)
+
+
+if __name__ == "__main__":
+    build_tables()
+    print(f"Wrote {', '.join(TABLE_MODULES)} to {BACKEND_DIR}")
@@ -0,0 +1,200 @@
+"""Clone-region localization between two ASTs (Baxter-style subtree hashing).
+
+Every subtree gets two hashes in one walk: a shape hash that ignores
+identifier names and literal values, and an exact hash that keeps them. Subtrees of the second AST are bucketed by shape hash, so candidate
+clone pairs are found by lookup instead of comparing every pair of nodes.
+Only maximal clones are reported, and runs of matching consecutive
+statements are merged into a single region.
+"""
+from hashlib import blake2b
+
+
+# Smallest subtree (in nodes) reported as a clone; `x = y;` is 3 nodes
+MIN_CLONE_SIZE = 5
+
+# Node types whose value is an identifier name or a literal
+PARAMETER_TYPES = ('identifier', 'number', 'float', 'string')
+
+
+def _digest(label, child_hashes):
+    digest = blake2b(digest_size=8)
+    digest.update(label.encode())
+    for child_hash in child_hashes:
+        digest.update(b"\x1e")
+        digest.update(child_hash)
+    return digest.digest()
+
+
+def _exact_label(node):
+    return f"{node.type}\x1f{node.value!r}"
+
+
+def subtree_hash(node, child_hashes):
+    """Structural hash of a node, names and values included, given the hashes of its children"""
+    return _digest(_exact_label(node), child_hashes)
+
+
+class SubtreeIndex:
+    """Size, hashes and position of every subtree of one AST, keyed by id(node)
+
+    The index builds itself with one walk of ``ast``; a caller that already
+    walks the tree (pipeline.analyze_tree) can leave ``ast`` out and call
+    enter and exit on each node instead.
+    """
+
+    def __init__(self, ast=None):
+        self.nodes = {}
+        self.parents = {}
+        self.positions = {}
+        self.sizes = {}
+        self.shape_hashes = {}
+        self.exact_hashes = {}
+        # Node ids in preorder; a subtree is the run of `size` ids from its node
+        self.order = []
+        self.starts = {}
+
+        if ast is None:
+            return
+        stack = [(ast, None, None, False)]
+        while stack:
+            node, parent, position, done = stack.pop()
+            if done:
+                self.exit(node)
+                continue
+            self.enter(node, parent, position)
+            stack.append((node, None, None, True))
+            for position in range(len(node.children) - 1, -1, -1):
+                child = node.children[position]
+                if child is not None:
+                    stack.append((child, node, position, False))
+
+    def enter(self, node, parent, position):
+        """Record a node when the walk reaches it, before its children"""
+        key = id(node)
+        self.nodes[key] = node
+        self.parents[key] = parent
+        if parent is not None:
+            self.positions[key] = position
+        self.starts[key] = len(self.order)
+        self.order.append(key)
+
+    def exit(self, node):
+        """Size and hash a node once all of its children have been exited"""
+        key = id(node)
+        size = 1
+        shape_children = []
+        exact_children = []
+        for child in node.children:
+            if child is None:
+                continue
+            child_key = id(child)
+            size += self.sizes[child_key]
+            shape_children.append(self.shape_hashes[child_key])
+            exact_children.append(self.exact_hashes[child_key])
+
+        exact_label = _exact_label(node)
+        shape_label = node.type if node.type in PARAMETER_TYPES else exact_label
+        self.sizes[key] = size
+        self.shape_hashes[key] = _digest(shape_label, shape_children)
+        self.exact_hashes[key] = _digest(exact_label, exact_children)
+
+    def subtree(self, key):
+        """Ids of the subtree rooted at key, in preorder"""
+        start = self.starts[key]
+        return self.order[start:start + self.sizes[key]]
+
+
+def _span(node):
+    return getattr(node, 'lineno', None), getattr(node, 'end_lineno', None)
+
+
+def _is_statement(index, key):
+    parent = index.parents.get(key)
+    return parent is not None and parent.type == 'statement_list'
+
+
+def find_clones(ast1, ast2, min_size=MIN_CLONE_SIZE, index1=None, index2=None):
+    """List matching regions between two ASTs with their line ranges, size and clone type
+
+    ``index1`` and ``index2`` are SubtreeIndex objects the caller already
+    built for the two trees; missing ones are built here.
+    """
+    if ast1 is None or ast2 is None:
+        return []
+
+    if index1 is None:
+        index1 = SubtreeIndex(ast1)
+    if index2 is None:
+        index2 = SubtreeIndex(ast2)
+
+    # Buckets hold tree 2 subtrees in preorder, so larger clones come first
+    buckets = {}
+    for key in index2.order:
+        if index2.sizes[key] >= min_size:
+            buckets.setdefault(index2.shape_hashes[key], []).append(key)
+    for bucket in buckets.values():
+        bucket.reverse()
+
+    # Visit tree 1 subtrees largest first (preorder among equal sizes) and
+    # pair each with the first unused match. As in Baxter's algorithm,
+    # subtrees of a reported clone are not reported again, and each tree 2
+    # subtree is used at most once, which keeps the search close to linear
+    # even when many statements share one shape. Largest first also means a
+    # match can never be an ancestor of an earlier one, so regions in tree 2
+    # do not overlap either.
+    candidates = [key for key in index1.order if index1.sizes[key] >= min_size]
+    candidates.sort(key=lambda key: -index1.sizes[key])
+    covered1 = set()
+    covered2 = set()
+    matches = []
+    for key1 in candidates:
+        if key1 in covered1:
+            continue
+        bucket = buckets.get(index1.shape_hashes[key1])
+        while bucket and bucket[-1] in covered2:
+            bucket.pop()
+        if not bucket:
+            continue
+        key2 = bucket.pop()
+        matches.append((key1, key2))
+        covered1.update(index1.subtree(key1))
+        covered2.update(index2.subtree(key2))
+
+    # Merge runs of consecutive statements cloned in the same order
+    runs = {}
+    regions = []
+    for key1, key2 in matches:
+        if _is_statement(index1, key1) and _is_statement(index2, key2):
+            position1 = index1.positions[key1]
+            diagonal = (id(index1.parents[key1]), id(index2.parents[key2]),
+                        position1 - index2.positions[key2])
+            runs.setdefault(diagonal, []).append((position1, key1, key2))
+        else:
+            regions.append([(key1, key2)])
+
+    for members in runs.values():
+        members.sort()
+        current = [members[0]]
+        for member in members[1:]:
+            if member[0] != current[-1][0] + 1:
+                regions.append([(key1, key2) for _, key1, key2 in current])
+                current = []
+            current.append(member)
+        regions.append([(key1, key2) for _, key1, key2 in current])
+
+    clones = []
+    for region in regions:
+        start1, _ = _span(index1.nodes[region[0][0]])
+        start2, _ = _span(index2.nodes[region[0][1]])
+        _, end1 = _span(index1.nodes[region[-1][0]])
+        _, end2 = _span(index2.nodes[region[-1][1]])
+        exact = all(index1.exact_hashes[key1] == index2.exact_hashes[key2] for key1, key2 in region)
+        clones.append({
+            'lines1': [start1, end1],
+            'lines2': [start2, end2],
+            'size': sum(index1.sizes[key1] for key1, _ in region),
+            'type': 'type-1' if exact else 'type-2',
+        })
+
+    clones.sort(key=lambda clone: (clone['lines1'][0] or 0, clone['lines2'][0] or 0))
+    return clones
@@ -0,0 +1,204 @@
+"""Sharded index of past submissions, served by local worker processes.
+
+Submissions are assigned to one of N shards by a hash of their id. Each
+shard runs in its own process and owns the parsed ASTs and clone
+fingerprints of its submissions, plus an inverted index from fingerprint to
+submission. A query is scattered to every shard, which returns its best
+candidates by fingerprint overlap; the coordinator merges them into a global
+shortlist, asks the owning shards to re-rank it with the exact
+calculate_similarity and keeps the top k.
+"""
+import heapq
+import multiprocessing
+import os
+import threading
+from hashlib import blake2b
+
+from .ast_compare import calculate_similarity
+from .clones import MIN_CLONE_SIZE, SubtreeIndex
+from .parser import parse_code
+
+# Shards started when no count is given; override with CORPUS_SHARDS
+DEFAULT_SHARDS = 2
+
+# Candidates each shard returns for a query before the global merge
+CANDIDATES_PER_SHARD = 20
+
+
+def shard_for(submission_id, shard_count):
+    """Shard that owns a submission; stable across processes and restarts"""
+    digest = blake2b(str(submission_id).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') % shard_count
+
+
+def fingerprints(ast, min_size=MIN_CLONE_SIZE):
+    """Set of shape hashes of the subtrees with at least min_size nodes"""
+    if ast is None:
+        return set()
+    index = SubtreeIndex(ast)
+    return {index.shape_hashes[key] for key, size in index.sizes.items() if size >= min_size}
+
+
+class Shard:
+    """Submissions owned by one worker process"""
+
+    def __init__(self):
+        self.asts = {}
+        self.fingerprints = {}
+        # fingerprint -> ids of the submissions containing it
+        self.postings = {}
+
+    def add(self, submission_id, code):
+        ast = parse_code(code)
+        if ast is None:
+            raise ValueError(f"Could not parse submission '{submission_id}'")
+        self.remove(submission_id)
+        prints = fingerprints(ast)
+        self.asts[submission_id] = ast
+        self.fingerprints[submission_id] = prints
+        for fingerprint in prints:
+            self.postings.setdefault(fingerprint, set()).add(submission_id)
+        return len(prints)
+
+    def remove(self, submission_id):
+        for fingerprint in self.fingerprints.pop(submission_id, ()):
+            owners = self.postings[fingerprint]
+            owners.discard(submission_id)
+            if not owners:
+                del self.postings[fingerprint]
+        return self.asts.pop(submission_id, None) is not None
+
+    def candidates(self, query_prints, limit):
+        """Best (score, id) pairs by Jaccard overlap of fingerprints"""
+        overlap = {}
+        for fingerprint in query_prints:
+            for submission_id in self.postings.get(fingerprint, ()):
+                overlap[submission_id] = overlap.get(submission_id, 0) + 1
+        scored = (
+            (shared / (len(query_prints) + len(self.fingerprints[submission_id]) - shared), submission_id)
+            for submission_id, shared in overlap.items()
+        )
+        return heapq.nlargest(limit, scored)
+
+    def rerank(self, code, submission_ids):
+        """Exact similarity between the query and each listed submission"""
+        ast = parse_code(code)
+        return [
+            (calculate_similarity(ast, self.asts[submission_id]), submission_id)
+            for submission_id in submission_ids if submission_id in self.asts
+        ]
+
+    def stats(self):
+        return {'submissions': len(self.asts), 'fingerprints': len(self.postings)}
+
+
+def _serve_shard(conn):
+    """Worker loop: run shard commands received over the pipe until 'stop'"""
+    shard = Shard()
+    while True:
+        command, args = conn.recv()
+        if command == 'stop':
+            conn.close()
+            return
+        try:
+            conn.send(('ok', getattr(shard, command)(*args)))
+        except Exception as e:
+            conn.send(('error', str(e)))
+
+
+class ShardedIndex:
+    """Coordinator that fans requests out to the shard worker processes"""
+
+    def __init__(self, shard_count=None):
+        if shard_count is None:
+            shard_count = int(os.environ.get('CORPUS_SHARDS', DEFAULT_SHARDS))
+        if shard_count < 1:
+            raise ValueError("shard_count must be at least 1")
+        self.shard_count = shard_count
+        self.connections = []
+        self.processes = []
+        self._lock = threading.Lock()
+
+        # spawn keeps workers independent of the server's threads
+        context = multiprocessing.get_context('spawn')
+        for _ in range(shard_count):
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(target=_serve_shard, args=(child_conn,), daemon=True)
+            process.start()
+            child_conn.close()
+            self.connections.append(parent_conn)
+            self.processes.append(process)
+
+    def _gather(self, requests):
+        """Send {shard: (command, args)} to the shards at once, then collect the replies"""
+        with self._lock:
+            for shard, request in requests.items():
+                self.connections[shard].send(request)
+            # Read every reply before raising so no stale one is left in a pipe
+            replies = {shard: self.connections[shard].recv() for shard in requests}
+        for status, value in replies.values():
+            if status == 'error':
+                raise ValueError(value)
+        return {shard: value for shard, (_, value) in replies.items()}
+
+    def add(self, submission_id, code):
+        """Store a submission on its shard and return its fingerprint count"""
+        shard = shard_for(submission_id, self.shard_count)
+        return self._gather({shard: ('add', (submission_id, code))})[shard]
+
+    def remove(self, submission_id):
+        shard = shard_for(submission_id, self.shard_count)
+        return self._gather({shard: ('remove', (submission_id,))})[shard]
+
+    def query(self, code, k=5):
+        """Top-k stored submissions most similar to code, ranked by exact similarity"""
+        query_prints = fingerprints(parse_code(code))
+        if not query_prints:
+            return []
+
+        # Scatter: every shard proposes its best candidates by fingerprint overlap
+        limit = max(k, CANDIDATES_PER_SHARD)
+        replies = self._gather({
+            shard: ('candidates', (query_prints, limit))
+            for shard in range(self.shard_count)
+        })
+        merged = heapq.nlargest(limit, (candidate for found in replies.values() for candidate in found))
+        overlap = {submission_id: score for score, submission_id in merged}
+
+        # Gather: the owning shards re-rank the merged candidates exactly, so a
+        # close match with a lower overlap can still reach the top k
+        by_shard = {}
+        for _, submission_id in merged:
+            by_shard.setdefault(shard_for(submission_id, self.shard_count), []).append(submission_id)
+        if not by_shard:
+            return []
+        reranked = self._gather({shard: ('rerank', (code, ids)) for shard, ids in by_shard.items()})
+
+        results = [
+            {'id': submission_id, 'similarity': similarity, 'overlap': overlap[submission_id]}
+            for found in reranked.values() for similarity, submission_id in found
+        ]
+        results.sort(key=lambda result: (-result['similarity'], -result['overlap']))
+        return results[:k]
+
+    def stats(self):
+        replies = self._gather({shard: ('stats', ()) for shard in range(self.shard_count)})
+        return [replies[shard] for shard in range(self.shard_count)]
+
+    def close(self):
+        for conn, process in zip(self.connections, self.processes):
+            try:
+                conn.send(('stop', ()))
+            except (BrokenPipeError, OSError):
+                pass
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self.connections = []
+        self.processes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,131 @@
+"""Content negotiation and compression for API responses.
+
+Clients pick the body format with the Accept header:
+
+- ``application/json`` (default), written with json.dumps directly instead
+  of FastAPI's generic encoder
+- ``application/msgpack`` when the msgpack package is installed
+- ``application/vnd.codeplag.similarity-matrix`` for similarity matrices:
+  a compact binary layout with an id table and the float32 upper triangle
+
+and the compression with Accept-Encoding (``zstd`` when the zstandard
+package is installed, otherwise ``gzip``). Small bodies are sent as is.
+"""
+import gzip
+import json
+import struct
+import sys
+from array import array
+
+from fastapi import Response
+
+JSON_TYPE = "application/json"
+MSGPACK_TYPE = "application/msgpack"
+MATRIX_TYPE = "application/vnd.codeplag.similarity-matrix"
+
+# Bodies smaller than this are not worth compressing
+MIN_COMPRESS_SIZE = 1024
+
+# Header: magic, format version, number of ids
+MATRIX_MAGIC = b"SIMX"
+MATRIX_VERSION = 1
+_MATRIX_HEADER = struct.Struct("<4sBI")
+_ID_LENGTH = struct.Struct("<H")
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def encode_matrix(ids, upper_triangle):
+    """Pack ids and the row-major upper triangle (i < j) of a similarity matrix"""
+    if len(upper_triangle) != len(ids) * (len(ids) - 1) // 2:
+        raise ValueError("upper triangle does not match the number of ids")
+    parts = [_MATRIX_HEADER.pack(MATRIX_MAGIC, MATRIX_VERSION, len(ids))]
+    for submission_id in ids:
+        encoded = str(submission_id).encode()
+        parts.append(_ID_LENGTH.pack(len(encoded)))
+        parts.append(encoded)
+    # Stored little-endian regardless of the platform
+    values = array('f', upper_triangle)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    parts.append(values.tobytes())
+    return b"".join(parts)
+
+
+def decode_matrix(data):
+    """Inverse of encode_matrix: return (ids, upper triangle as a list of floats)"""
+    magic, version, count = _MATRIX_HEADER.unpack_from(data)
+    if magic != MATRIX_MAGIC or version != MATRIX_VERSION:
+        raise ValueError("not a similarity matrix payload")
+    offset = _MATRIX_HEADER.size
+    ids = []
+    for _ in range(count):
+        (length,) = _ID_LENGTH.unpack_from(data, offset)
+        offset += _ID_LENGTH.size
+        ids.append(data[offset:offset + length].decode())
+        offset += length
+    values = array('f')
+    values.frombytes(data[offset:])
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return ids, values.tolist()
+
+
+def _accepts(header, media_type):
+    """Whether an Accept-style header lists media_type with a non-zero q-value"""
+    for part in header.split(','):
+        value, *params = part.split(';')
+        if value.strip().lower() != media_type:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, number = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(number)
+                except ValueError:
+                    pass
+        if quality > 0:
+            return True
+    return False
+
+
+def _compress(body, accept_encoding):
+    """Return (body, content encoding) using the best encoding the client accepts"""
+    if len(body) < MIN_COMPRESS_SIZE:
+        return body, None
+    if zstandard is not None and _accepts(accept_encoding, "zstd"):
+        return zstandard.ZstdCompressor(level=3).compress(body), "zstd"
+    if _accepts(accept_encoding, "gzip"):
+        return gzip.compress(body, compresslevel=5), "gzip"
+    return body, None
+
+
+def negotiated_response(request, payload, matrix=None):
+    """Encode payload in the format and compression the request asks for
+
+    ``matrix`` is an optional (ids, upper triangle) pair; when given and the
+    client accepts the matrix media type, only the matrix is sent.
+    """
+    accept = request.headers.get("accept", "")
+    if matrix is not None and _accepts(accept, MATRIX_TYPE):
+        body, media_type = encode_matrix(*matrix), MATRIX_TYPE
+    elif msgpack is not None and _accepts(accept, MSGPACK_TYPE):
+        body, media_type = msgpack.packb(payload), MSGPACK_TYPE
+    else:
+        body = json.dumps(payload, separators=(',', ':'), ensure_ascii=False).encode()
+        media_type = JSON_TYPE
+
+    body, content_encoding = _compress(body, request.headers.get("accept-encoding", ""))
+    headers = {"Vary": "Accept, Accept-Encoding"}
+    if content_encoding:
+        headers["Content-Encoding"] = content_encoding
+    return Response(content=body, media_type=media_type, headers=headers)
@@ -1,15 +1,32 @@
-try:
-    from graphviz import Digraph
-except ImportError:
-    print("Warning: Graphviz not installed. Install with: pip install graphviz")
-    Digraph = None
+from .traversal import preorder
 
-def ast_to_graphviz(ast, graph_name="AST"):
-    """Convert AST to Graphviz DOT format"""
-    if Digraph is None:
-        raise ImportError("Graphviz is not installed")
+def _load_digraph():
+    """Import graphviz on first use so importing the backend stays cheap"""
+    try:
+        from graphviz import Digraph
+    except ImportError:
+        raise ImportError("Graphviz is not installed. Install with: pip install graphviz")
+    return Digraph
+
+def node_label(node):
+    """Label shown for a node in the AST graph"""
+    label = str(node.type) if hasattr(node, 'type') else 'Unknown'
+    if hasattr(node, 'value') and node.value is not None:
+        label += f"\n{node.value}"
+    return label
+
+def ast_elements(ast):
+    """List the (node_id, label, parent_id) entries that make up the AST graph"""
+    return [
+        (str(id(node)), node_label(node), str(id(parent)) if parent is not None else None)
+        for node, parent in preorder(ast)
+    ]
+
+def elements_to_graphviz(elements, graph_name="AST"):
+    """Build a Graphviz graph from (node_id, label, parent_id) entries"""
+    Digraph = _load_digraph()
     
-    if ast is None:
+    if not elements:
         dot = Digraph(name=graph_name, format='svg')
         dot.node('empty', 'Empty AST')
         return dot
@@ -17,31 +34,27 @@ def ast_to_graphviz(ast, graph_name="AST"):
     dot = Digraph(name=graph_name, format='svg')
     dot.attr('node', shape='box')
     
-    def add_nodes_edges(node, parent_id=None):
-        if node is None:
-            return
-        
-        # Create node ID
-        node_id = str(id(node))
-        
-        # Create node label
-        label = str(node.type) if hasattr(node, 'type') else 'Unknown'
-        if hasattr(node, 'value') and node.value is not None:
-            label += f"\n{node.value}"
+    for node_id, label, parent_id in elements:
         dot.node(node_id, label)
         
         # Connect to parent if exists
         if parent_id is not None:
             dot.edge(parent_id, node_id)
-        
-        # Add children
-        if hasattr(node, 'children'):
-            for child in node.children:
-                add_nodes_edges(child, node_id)
     
-    add_nodes_edges(ast)
     return dot
 
+def ast_to_graphviz(ast, graph_name="AST"):
+    """Convert AST to Graphviz DOT format"""
+    return elements_to_graphviz(ast_elements(ast), graph_name)
+
+def elements_to_dot(elements, graph_name="AST"):
+    """Convert (node_id, label, parent_id) entries to a DOT format string"""
+    try:
+        dot = elements_to_graphviz(elements, graph_name)
+        return dot.source
+    except (ImportError, AttributeError) as e:
+        return f"// Error generating DOT: {e}"
+
 def ast_to_dot(ast, graph_name="AST"):
     """Convert AST to DOT format string"""
     try:
@@ -0,0 +1,195 @@
+"""Incremental re-comparison for snippets that change a little at a time.
+
+Source is split into top-level statements. Each statement is parsed once per
+distinct text, normalized once per distinct (text, variable numbering) pair,
+and the edit distance between two normalized statements is kept by their
+structural hashes. Re-comparing after a small edit only parses, normalizes
+and aligns the statements that actually changed; everything else comes from
+the caches and only the top-level statement alignment is redone.
+"""
+import threading
+from copy import copy
+
+from .ast_compare import ASTNormalizer, compare_code, similarity_score, tree_edit_distance
+from .clones import SubtreeIndex, find_clones
+from .parser import Node, parse_code
+from .streaming import iter_statements
+from .traversal import preorder
+
+# Cached entries kept per cache before it is cleared
+MAX_CACHE_ENTRIES = 20000
+
+
+def split_statements(code):
+    """Split source into top-level statements as (text, first line) pairs
+
+    Returns None when braces or parentheses do not balance, in which case
+    the caller should fall back to parsing the whole snippet.
+    """
+    try:
+        return list(iter_statements(code.splitlines(keepends=True)))
+    except ValueError:
+        return None
+
+
+def shift_lines(node, offset):
+    """Copy a parsed subtree with its line numbers moved down by offset"""
+    if offset == 0:
+        return node
+    root = []
+    stack = [(node, root)]
+    while stack:
+        source, siblings = stack.pop()
+        shifted = copy(source)
+        if shifted.lineno is not None:
+            shifted.lineno += offset
+        if shifted.end_lineno is not None:
+            shifted.end_lineno += offset
+        shifted.children = []
+        siblings.append(shifted)
+        for child in reversed(source.children):
+            stack.append((child, shifted.children))
+    return root[0]
+
+
+class NormalizedStatement:
+    """A normalized statement with the sizes and hashes of its subtrees"""
+
+    def __init__(self, node):
+        self.node = node
+        index = SubtreeIndex(node)
+        self.sizes = index.sizes
+        self.hashes = index.exact_hashes
+        self.size = self.sizes[id(node)]
+        self.hash = self.hashes[id(node)]
+
+
+class IncrementalComparer:
+    """Compare snippets while reusing work from earlier comparisons"""
+
+    def __init__(self, max_entries=MAX_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        # statement text -> (parsed statements, identifiers in preorder) or None
+        self.parsed = {}
+        # (statement text, numbering of its identifiers, variables seen) -> NormalizedStatement
+        self.normalized = {}
+        # (hash1, hash2) -> edit distance between two normalized statements
+        self.pair_costs = {}
+        self._lock = threading.Lock()
+
+    def _store(self, cache, key, value):
+        if len(cache) >= self.max_entries:
+            cache.clear()
+        cache[key] = value
+
+    def _parse_statement(self, text):
+        if text not in self.parsed:
+            ast = parse_code(text)
+            entry = None
+            if ast is not None and ast.children and ast.children[0].type == 'statement_list':
+                statements = ast.children[0].children
+                identifiers = []
+                seen = set()
+                for statement in statements:
+                    for node, _ in preorder(statement):
+                        if node.type == 'identifier' and node.value not in seen:
+                            seen.add(node.value)
+                            identifiers.append(node.value)
+                entry = (statements, identifiers)
+            self._store(self.parsed, text, entry)
+        return self.parsed[text]
+
+    def _build(self, code):
+        """Parse and normalize a snippet statement by statement
+
+        Returns (original AST, normalized statements) or None if the snippet
+        has to be handled as a whole.
+        """
+        chunks = split_statements(code)
+        if not chunks:
+            return None
+
+        originals = []
+        normalized = []
+        var_map = {}
+        for text, start_line in chunks:
+            entry = self._parse_statement(text)
+            if entry is None:
+                return None
+            statements, identifiers = entry
+            originals.extend(shift_lines(statement, start_line - 1) for statement in statements)
+
+            # The numbering this chunk sees depends on the statements before it:
+            # names already seen keep their number, new ones continue the count
+            numbering = tuple(var_map.get(name) for name in identifiers)
+            key = (text, numbering, len(var_map))
+            if key not in self.normalized:
+                normalizer = ASTNormalizer()
+                normalizer.var_map = dict(var_map)
+                normalizer.var_counter = len(var_map) + 1
+                self._store(self.normalized, key, [
+                    NormalizedStatement(normalizer.normalize(statement)) for statement in statements
+                ])
+            normalized.extend(self.normalized[key])
+
+            for name in identifiers:
+                if name not in var_map:
+                    var_map[name] = f'var{len(var_map) + 1}'
+
+        first_line = originals[0].lineno
+        last_line = originals[-1].end_lineno
+        ast = Node('program', [Node('statement_list', originals, lineno=first_line, end_lineno=last_line)],
+                   lineno=first_line, end_lineno=last_line)
+        return ast, normalized
+
+    def compare(self, code1, code2):
+        """Same result as compare_code, recomputing only what changed"""
+        with self._lock:
+            try:
+                built1 = self._build(code1)
+                built2 = self._build(code2)
+            except Exception:
+                built1 = built2 = None
+            if built1 is None or built2 is None:
+                return compare_code(code1, code2)
+
+            ast1, statements1 = built1
+            ast2, statements2 = built2
+
+            normalized1 = Node('program', [Node('statement_list', [s.node for s in statements1])])
+            normalized2 = Node('program', [Node('statement_list', [s.node for s in statements2])])
+            size1 = 2 + sum(s.size for s in statements1)
+            size2 = 2 + sum(s.size for s in statements2)
+
+            sizes = {id(normalized1): size1, id(normalized1.children[0]): size1 - 1,
+                     id(normalized2): size2, id(normalized2.children[0]): size2 - 1}
+            hashes = {}
+            memo = {}
+            for statement in statements1 + statements2:
+                sizes.update(statement.sizes)
+                hashes.update(statement.hashes)
+
+            # Seed the alignment with every statement pair compared before
+            missing = []
+            for first in statements1:
+                for second in statements2:
+                    cost = self.pair_costs.get((first.hash, second.hash))
+                    if cost is None:
+                        missing.append((first, second))
+                    else:
+                        memo[(id(first.node), id(second.node))] = cost
+
+            distance = tree_edit_distance(normalized1, normalized2, memo, sizes, hashes)
+
+            for first, second in missing:
+                self._store(self.pair_costs, (first.hash, second.hash),
+                            memo[(id(first.node), id(second.node))])
+
+            return {
+                'similarity': similarity_score(distance, size1, size2),
+                'mode': 'ast',
+                'ast1': ast1,
+                'ast2': ast2,
+                'clones': find_clones(ast1, ast2),
+                'tiles': []
+            }
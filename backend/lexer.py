@@ -1,3 +1,5 @@
+import threading
+
 import ply.lex as lex
 
 # List of token names
@@ -79,17 +81,26 @@ def t_error(t):
     print(f"Illegal character '{t.value[0]}'")
     t.lexer.skip(1)
 
-# Build the lexer
-lexer = lex.lex()
+# Build the lexer from the pregenerated lextab (see build_tables.py)
+lexer = lex.lex(optimize=1, lextab='lextab')
+
+# The shared lexer (and the parser driving it) keep per-input state, so only
+# one thread may use them at a time
+lexer_lock = threading.Lock()
 
 def tokenize_code(code):
     """Tokenize the input code and return the token list"""
-    lexer.input(code)
-    tokens = []
-    while True:
-        tok = lexer.token()
-        if not tok:
-            break
-        tokens.append((tok.type, tok.value))
-    (tokens)
+    return [(type, value) for type, value, _ in tokenize_with_lines(code)]
+
+def tokenize_with_lines(code):
+    """Tokenize the input code and return (type, value, lineno) tuples"""
+    with lexer_lock:
+        lexer.lineno = 1
+        lexer.input(code)
+        tokens = []
+        while True:
+            tok = lexer.token()
+            if not tok:
+                break
+            tokens.append((tok.type, tok.value, tok.lineno))
     return tokens
\ No newline at end of file
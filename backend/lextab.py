@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ASSIGN', 'BOOL', 'COMMA', 'DIVIDE', 'ELSE', 'EQ', 'FLOAT', 'FLOAT_NUMBER', 'FOR', 'GE', 'GT', 'ID', 'IF', 'INT', 'LBRACE', 'LE', 'LPAREN', 'LT', 'MINUS', 'MODULO', 'NE', 'NUMBER', 'PLUS', 'RBRACE', 'RETURN', 'RPAREN', 'SEMICOLON', 'STRING', 'STRING_LITERAL', 'TIMES', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_ID>[a-zA-Z_][a-zA-Z_0-9]*)|(?P<t_FLOAT_NUMBER>\\d+\\.\\d+)|(?P<t_NUMBER>\\d+)|(?P<t_STRING_LITERAL>\\"([^\\\\\\n]|(\\\\.))*?\\")|(?P<t_newline>\\n+)|(?P<t_comment>//.*)|(?P<t_PLUS>\\+)|(?P<t_TIMES>\\*)|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))|(?P<t_LBRACE>\\{)|(?P<t_RBRACE>\\})|(?P<t_EQ>==)|(?P<t_NE>!=)|(?P<t_LE><=)|(?P<t_GE>>=)|(?P<t_MINUS>-)|(?P<t_DIVIDE>/)|(?P<t_MODULO>%)|(?P<t_SEMICOLON>;)|(?P<t_COMMA>,)|(?P<t_LT><)|(?P<t_GT>>)|(?P<t_ASSIGN>=)', [None, ('t_ID', 'ID'), ('t_FLOAT_NUMBER', 'FLOAT_NUMBER'), ('t_NUMBER', 'NUMBER'), ('t_STRING_LITERAL', 'STRING_LITERAL'), None, None, ('t_newline', 'newline'), ('t_comment', 'comment'), (None, 'PLUS'), (None, 'TIMES'), (None, 'LPAREN'), (None, 'RPAREN'), (None, 'LBRACE'), (None, 'RBRACE'), (None, 'EQ'), (None, 'NE'), (None, 'LE'), (None, 'GE'), (None, 'MINUS'), (None, 'DIVIDE'), (None, 'MODULO'), (None, 'SEMICOLON'), (None, 'COMMA'), (None, 'LT'), (None, 'GT'), (None, 'ASSIGN')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
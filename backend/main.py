@@ -1,22 +1,37 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from typing import List, Literal
+from contextlib import asynccontextmanager
 import sys
 import os
+import threading
 
 # Add current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 try:
     from .ast_compare import compare_code
-    from .graphviz_utils import ast_to_dot
-    from .semantics import analyze_semantics  # Changed from semantic to semantics
-    from .parser import parse_code
+    from .graphviz_utils import ast_to_dot, elements_to_dot
+    from .pipeline import analyze_code, similarity_matrix
+    from .encoding import negotiated_response
+    from .corpus import ShardedIndex, shard_for
+    from .semantic import semantics_to_dict
+    from .semantic_batch import SemanticBatch
 except ImportError as e:
     print(f"Import error: {e}")
     print("Make sure all required files are in the same directory")
 
-app = FastAPI(title="Code Plagiarism Detector API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app):
+    yield
+    # Stop the worker processes the corpus and semantic endpoints started on demand
+    if corpus_index is not None:
+        corpus_index.close()
+    if semantic_batch is not None:
+        semantic_batch.close()
+
+app = FastAPI(title="Code Plagiarism Detector API", version="1.0.0", lifespan=lifespan)
 
 # CORS configuration
 app.add_middleware(
@@ -30,40 +45,103 @@ app.add_middleware(
 class CodeComparisonRequest(BaseModel):
     code1: str
     code2: str
+    mode: Literal["ast", "tokens"] = "ast"
+    include_ast: bool = True
+
+class CodeAnalysisRequest(BaseModel):
+    code1: str
+    code2: str
 
 class SemanticAnalysisRequest(BaseModel):
     code: str
 
+class SubmissionRequest(BaseModel):
+    id: str
+    code: str
+
+class CorpusQueryRequest(BaseModel):
+    code: str
+    k: int = Field(5, ge=1)
+
+class SimilarityMatrixRequest(BaseModel):
+    submissions: List[SubmissionRequest]
+    mode: Literal["ast", "tokens"] = "ast"
+
+class SemanticBatchRequest(BaseModel):
+    submissions: List[SubmissionRequest]
+
+# Shard workers are started on first use; CORPUS_SHARDS sets how many
+corpus_index = None
+corpus_index_lock = threading.Lock()
+
+def get_corpus_index():
+    global corpus_index
+    # Endpoints run in threadpool threads; only the first caller starts workers
+    with corpus_index_lock:
+        if corpus_index is None:
+            corpus_index = ShardedIndex()
+    return corpus_index
+
+# Semantic results are cached by source hash; the worker pool starts with the first large batch
+semantic_batch = None
+semantic_batch_lock = threading.Lock()
+
+def get_semantic_batch():
+    global semantic_batch
+    with semantic_batch_lock:
+        if semantic_batch is None:
+            semantic_batch = SemanticBatch()
+    return semantic_batch
+
 @app.get("/")
 async def root():
     return {"message": "Code Plagiarism Detector API", "version": "1.0.0"}
 
 @app.post("/api/compare")
-async def compare_code_snippets(request: CodeComparisonRequest):
+async def compare_code_snippets(request: CodeComparisonRequest, http_request: Request):
     try:
-        result = compare_code(request.code1, request.code2)
+        result = compare_code(request.code1, request.code2, request.mode)
         
         if 'error' in result:
             raise HTTPException(status_code=400, detail=result['error'])
         
-        # Convert ASTs to DOT format if they exist
-        dot1 = ast_to_dot(result['ast1'], "AST1") if result['ast1'] else "// No AST generated"
-        dot2 = ast_to_dot(result['ast2'], "AST2") if result['ast2'] else "// No AST generated"
+        # Convert ASTs to DOT format if they exist and were asked for
+        dot1 = dot2 = None
+        if request.include_ast:
+            dot1 = ast_to_dot(result['ast1'], "AST1") if result['ast1'] else "// No AST generated"
+            dot2 = ast_to_dot(result['ast2'], "AST2") if result['ast2'] else "// No AST generated"
         
-        return {
+        return negotiated_response(http_request, {
             "similarity": result['similarity'],
+            "mode": result['mode'],
             "ast1": dot1,
             "ast2": dot2,
+            "clones": result['clones'],
+            "tiles": result['tiles'],
             "status": "success"
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error analyzing code: {str(e)}")
 
+@app.post("/api/compare/matrix")
+async def compare_matrix(request: SimilarityMatrixRequest, http_request: Request):
+    """Pairwise similarity of many submissions; supports the binary matrix format"""
+    try:
+        ids = [submission.id for submission in request.submissions]
+        upper_triangle = similarity_matrix([submission.code for submission in request.submissions], request.mode)
+        return negotiated_response(http_request, {
+            "ids": ids,
+            "mode": request.mode,
+            "upper_triangle": upper_triangle,
+            "status": "success"
+        }, matrix=(ids, upper_triangle))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Error comparing submissions: {str(e)}")
+
 @app.post("/api/semantic")
 async def analyze_code_semantics(request: SemanticAnalysisRequest):
     try:
-        ast = parse_code(request.code)
-        result = analyze_semantics(ast)
+        result = semantics_to_dict(*get_semantic_batch().analyze([request.code])[0])
         
         return {
             "errors": result['errors'],
@@ -74,6 +152,89 @@ async def analyze_code_semantics(request: SemanticAnalysisRequest):
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error in semantic analysis: {str(e)}")
 
+@app.post("/api/semantic/batch")
+def analyze_semantics_batch(request: SemanticBatchRequest):
+    """Semantic checks for many submissions, e.g. a whole class, in one call"""
+    try:
+        batch = get_semantic_batch()
+        results = batch.analyze([submission.code for submission in request.submissions])
+        return {
+            "results": [
+                {"id": submission.id, **semantics_to_dict(*result)}
+                for submission, result in zip(request.submissions, results)
+            ],
+            "cache": batch.stats(),
+            "status": "success"
+        }
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Error in semantic analysis: {str(e)}")
+
+@app.post("/api/analyze")
+async def analyze_code_snippets(request: CodeAnalysisRequest, http_request: Request):
+    """Similarity, AST graphs and semantic checks for both snippets in one call"""
+    try:
+        result = analyze_code(request.code1, request.code2)
+        
+        if 'error' in result:
+            raise HTTPException(status_code=400, detail=result['error'])
+        
+        tree1 = result['tree1']
+        tree2 = result['tree2']
+        
+        # DOT output comes from the graph entries collected during the same walk
+        dot1 = elements_to_dot(tree1['elements'], "AST1") if result['ast1'] else "// No AST generated"
+        dot2 = elements_to_dot(tree2['elements'], "AST2") if result['ast2'] else "// No AST generated"
+        
+        return negotiated_response(http_request, {
+            "similarity": result['similarity'],
+            "ast1": dot1,
+            "ast2": dot2,
+            "clones": result['clones'],
+            "semantic1": tree1['semantics'],
+            "semantic2": tree2['semantics'],
+            "size1": tree1['size'],
+            "size2": tree2['size'],
+            "hash1": tree1['hash'].hex() if tree1['hash'] else None,
+            "hash2": tree2['hash'].hex() if tree2['hash'] else None,
+            "status": "success"
+        })
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Error analyzing code: {str(e)}")
+
+# Corpus endpoints block on the shard workers, so they run in the threadpool
+@app.post("/api/corpus/submissions")
+def add_submission(request: SubmissionRequest):
+    try:
+        index = get_corpus_index()
+        fingerprint_count = index.add(request.id, request.code)
+        return {
+            "id": request.id,
+            "shard": shard_for(request.id, index.shard_count),
+            "fingerprints": fingerprint_count,
+            "status": "success"
+        }
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Error adding submission: {str(e)}")
+
+@app.delete("/api/corpus/submissions/{submission_id}")
+def remove_submission(submission_id: str):
+    if not get_corpus_index().remove(submission_id):
+        raise HTTPException(status_code=404, detail=f"Unknown submission '{submission_id}'")
+    return {"id": submission_id, "status": "success"}
+
+@app.post("/api/corpus/query")
+def query_corpus(request: CorpusQueryRequest):
+    try:
+        results = get_corpus_index().query(request.code, request.k)
+        return {"results": results, "status": "success"}
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Error querying corpus: {str(e)}")
+
+@app.get("/api/corpus/stats")
+def corpus_stats():
+    index = get_corpus_index()
+    return {"shard_count": index.shard_count, "shards": index.stats()}
+
 @app.get("/api/health")
 async def health_check():
     return {"status": "healthy", "message": "API is running"}
@@ -1,16 +1,24 @@
 import ply.yacc as yacc
-from .lexer import tokens  # Changed from 'lexer' to '.lexer' for relative import
+from .lexer import tokens, lexer, lexer_lock  # Changed from 'lexer' to '.lexer' for relative import
 
 # AST Node classes
 class Node:
-    def __init__(self, type, children=None, value=None):
+    def __init__(self, type, children=None, value=None, lineno=None, end_lineno=None):
         self.type = type
         self.children = children if children is not None else []
         self.value = value
+        # Source lines covered by this node (filled in by the grammar rules)
+        self.lineno = lineno
+        self.end_lineno = end_lineno if end_lineno is not None else lineno
 
     def __repr__(self):
         return f"{self.type}: {self.value}" if self.value else self.type
 
+def located(node, p):
+    """Attach the line span of the production being reduced to a node"""
+    node.lineno, node.end_lineno = p.linespan(0)
+    return node
+
 # Precedence rules
 precedence = (
     ('left', 'PLUS', 'MINUS'),
@@ -20,16 +28,16 @@ precedence = (
 # Grammar rules
 def p_program(p):
     '''program : statement_list'''
-    p[0] = Node('program', [p[1]])
+    p[0] = located(Node('program', [p[1]]), p)
 
 def p_statement_list(p):
     '''statement_list : statement
                      | statement_list statement'''
     if len(p) == 2:
-        p[0] = Node('statement_list', [p[1]])
+        p[0] = located(Node('statement_list', [p[1]]), p)
     else:
         p[1].children.append(p[2])
-        p[0] = p[1]
+        p[0] = located(p[1], p)
 
 def p_statement(p):
     '''statement : declaration
@@ -44,16 +52,16 @@ def p_declaration(p):
     '''declaration : type ID SEMICOLON
                    | type ID ASSIGN expression SEMICOLON'''
     if len(p) == 4:
-        p[0] = Node('declaration', [
-            Node('type', value=p[1]),
-            Node('identifier', value=p[2])
-        ])
+        p[0] = located(Node('declaration', [
+            Node('type', value=p[1], lineno=p.lineno(1)),
+            Node('identifier', value=p[2], lineno=p.lineno(2))
+        ]), p)
     else:
-        p[0] = Node('declaration', [
-            Node('type', value=p[1]),
-            Node('identifier', value=p[2]),
+        p[0] = located(Node('declaration', [
+            Node('type', value=p[1], lineno=p.lineno(1)),
+            Node('identifier', value=p[2], lineno=p.lineno(2)),
             p[4]
-        ])
+        ]), p)
 
 def p_type(p):
     '''type : INT
@@ -64,26 +72,26 @@ def p_type(p):
 
 def p_assignment(p):
     '''assignment : ID ASSIGN expression SEMICOLON'''
-    p[0] = Node('assignment', [
-        Node('identifier', value=p[1]),
+    p[0] = located(Node('assignment', [
+        Node('identifier', value=p[1], lineno=p.lineno(1)),
         p[3]
-    ])
+    ]), p)
 
 def p_if_statement(p):
     '''if_statement : IF LPAREN expression RPAREN LBRACE statement_list RBRACE
                     | IF LPAREN expression RPAREN LBRACE statement_list RBRACE ELSE LBRACE statement_list RBRACE'''
     if len(p) == 8:
-        p[0] = Node('if', [p[3], p[6]])
+        p[0] = located(Node('if', [p[3], p[6]]), p)
     else:
-        p[0] = Node('if', [p[3], p[6], p[10]])
+        p[0] = located(Node('if', [p[3], p[6], p[10]]), p)
 
 def p_while_statement(p):
     '''while_statement : WHILE LPAREN expression RPAREN LBRACE statement_list RBRACE'''
-    p[0] = Node('while', [p[3], p[6]])
+    p[0] = located(Node('while', [p[3], p[6]]), p)
 
 def p_for_statement(p):
     '''for_statement : FOR LPAREN declaration expression SEMICOLON expression RPAREN LBRACE statement_list RBRACE'''
-    p[0] = Node('for', [p[3], p[4], p[6], p[9]])
+    p[0] = located(Node('for', [p[3], p[4], p[6], p[9]]), p)
 
 def p_expression_statement(p):
     '''expression_statement : expression SEMICOLON'''
@@ -107,11 +115,11 @@ def p_binary_expression(p):
                          | expression LE expression
                          | expression GT expression
                          | expression GE expression'''
-    p[0] = Node('binary', [p[1], p[3]], value=p[2])
+    p[0] = located(Node('binary', [p[1], p[3]], value=p[2]), p)
 
 def p_unary_expression(p):
     '''unary_expression : MINUS expression'''
-    p[0] = Node('unary', [p[2]], value=p[1])
+    p[0] = located(Node('unary', [p[2]], value=p[1]), p)
 
 def p_primary_expression(p):
     '''primary_expression : ID
@@ -121,13 +129,13 @@ def p_primary_expression(p):
                           | LPAREN expression RPAREN'''
     if len(p) == 2:
         if isinstance(p[1], int):
-            p[0] = Node('number', value=p[1])
+            p[0] = Node('number', value=p[1], lineno=p.lineno(1))
         elif isinstance(p[1], float):
-            p[0] = Node('float', value=p[1])
+            p[0] = Node('float', value=p[1], lineno=p.lineno(1))
         elif p.slice[1].type == 'STRING_LITERAL':
-            p[0] = Node('string', value=p[1])
+            p[0] = Node('string', value=p[1], lineno=p.lineno(1))
         else:
-            p[0] = Node('identifier', value=p[1])
+            p[0] = Node('identifier', value=p[1], lineno=p.lineno(1))
     else:
         p[0] = p[2]
 
@@ -137,9 +145,13 @@ def p_error(p):
     else:
         print("Syntax error at EOF")
 
-# Build the parser
-parser = yacc.yacc()
+# Build the parser from the pregenerated parsetab (see build_tables.py).
+# Tables are never written at import time so read-only installs keep working.
+parser = yacc.yacc(optimize=True, debug=False, write_tables=False, tabmodule='parsetab')
 
-def parse_code(code):
+def parse_code(code, first_line=1):
     """Parse the input code and return the AST"""
-    return parser.parse(code)
\ No newline at end of file
+    # Line numbers restart for every snippet; tracking records node spans
+    with lexer_lock:
+        lexer.lineno = first_line
+        return parser.parse(code, lexer=lexer, tracking=True)
\ No newline at end of file
@@ -0,0 +1,71 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'leftPLUSMINUSleftTIMESDIVIDEMODULOASSIGN BOOL COMMA DIVIDE ELSE EQ FLOAT FLOAT_NUMBER FOR GE GT ID IF INT LBRACE LE LPAREN LT MINUS MODULO NE NUMBER PLUS RBRACE RETURN RPAREN SEMICOLON STRING STRING_LITERAL TIMES WHILEprogram : statement_liststatement_list : statement\n                     | statement_list statementstatement : declaration\n                 | assignment\n                 | if_statement\n                 | while_statement\n                 | for_statement\n                 | expression_statementdeclaration : type ID SEMICOLON\n                   | type ID ASSIGN expression SEMICOLONtype : INT\n            | FLOAT\n            | STRING\n            | BOOLassignment : ID ASSIGN expression SEMICOLONif_statement : IF LPAREN expression RPAREN LBRACE statement_list RBRACE\n                    | IF LPAREN expression RPAREN LBRACE statement_list RBRACE ELSE LBRACE statement_list RBRACEwhile_statement : WHILE LPAREN expression RPAREN LBRACE statement_list RBRACEfor_statement : FOR LPAREN declaration expression SEMICOLON expression RPAREN LBRACE statement_list RBRACEexpression_statement : expression SEMICOLONexpression : binary_expression\n                  | unary_expression\n                  | primary_expressionbinary_expression : expression PLUS expression\n                         | expression MINUS expression\n                         | expression TIMES expression\n                         | expression DIVIDE expression\n                         | expression MODULO expression\n                         | expression EQ expression\n                         | expression NE expression\n                         | expression LT expression\n                         | expression LE expression\n                         | expression GT expression\n                         | expression GE expressionunary_expression : MINUS expressionprimary_expression : ID\n                          | NUMBER\n                          | FLOAT_NUMBER\n                          | STRING_LITERAL\n                          | LPAREN expression RPAREN'
+    
+_lr_action_items = {'ID':([0,2,3,4,5,6,7,8,9,10,14,17,18,19,20,24,28,30,31,32,33,34,35,36,37,38,39,40,41,42,43,46,49,50,66,68,72,73,74,75,76,77,79,80,83,84,85,86,87,88,],[11,11,-2,-4,-5,-6,-7,-8,-9,29,45,-12,-13,-14,-15,45,-3,45,-21,45,45,45,45,45,45,45,45,45,45,45,45,45,-10,45,45,-16,-11,11,11,45,11,11,-17,-19,11,11,11,11,-20,-18,]),'IF':([0,2,3,4,5,6,7,8,9,28,31,49,68,72,73,74,76,77,79,80,83,84,85,86,87,88,],[13,13,-2,-4,-5,-6,-7,-8,-9,-3,-21,-10,-16,-11,13,13,13,13,-17,-19,13,13,13,13,-20,-18,]),'WHILE':([0,2,3,4,5,6,7,8,9,28,31,49,68,72,73,74,76,77,79,80,83,84,85,86,87,88,],[15,15,-2,-4,-5,-6,-7,-8,-9,-3,-21,-10,-16,-11,15,15,15,15,-17,-19,15,15,15,15,-20,-18,]),'FOR':([0,2,3,4,5,6,7,8,9,28,31,49,68,72,73,74,76,77,79,80,83,84,85,86,87,88,],[16,16,-2,-4,-5,-6,-7,-8,-9,-3,-21,-10,-16,-11,16,16,16,16,-17,-19,16,16,16,16,-20,-18,]),'INT':([0,2,3,4,5,6,7,8,9,28,31,47,49,68,72,73,74,76,77,79,80,83,84,85,86,87,88,],[17,17,-2,-4,-5,-6,-7,-8,-9,-3,-21,17,-10,-16,-11,17,17,17,17,-17,-19,17,17,17,17,-20,-18,]),'FLOAT':([0,2,3,4,5,6,7,8,9,28,31,47,49,68,72,73,74,76,77,79,80,83,84,85,86,87,88,],[18,18,-2,-4,-5,-6,-7,-8,-9,-3,-21,18,-10,-16,-11,18,18,18,18,-17,-19,18,18,18,18,-20,-18,]),'STRING':([0,2,3,4,5,6,7,8,9,28,31,47,49,68,72,73,74,76,77,79,80,83,84,85,86,87,88,],[19,19,-2,-4,-5,-6,-7,-8,-9,-3,-21,19,-10,-16,-11,19,19,19,19,-17,-19,19,19,19,19,-20,-18,]),'BOOL':([0,2,3,4,5,6,7,8,9,28,31,47,49,68,72,73,74,76,77,79,80,83,84,85,86,87,88,],[20,20,-2,-4,-5,-6,-7,-8,-9,-3,-21,20,-10,-16,-11,20,20,20,20,-17,-19,20,20,20,20,-20,-18,]),'MINUS':([0,2,3,4,5,6,7,8,9,11,12,14,21,22,23,24,25,26,27,28,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,71,72,73,74,75,76,77,78,79,80,83,84,85,86,87,88,],[24,24,-2,-4,-5,-6,-7,-8,-9,-37,33,24,-22,-23,-24,24,-38,-39,-40,-3,24,-21,24,24,24,24,24,24,24,24,24,24,24,24,33,-37,24,-36,-10,24,33,-25,-26,-27,-28,-29,33,33,33,33,33,33,33,-41,33,24,33,-16,33,-11,24,24,24,24,24,33,-17,-19,24,24,24,24,-20,-18,]),'NUMBER':([0,2,3,4,5,6,7,8,9,14,24,28,30,31,32,33,34,35,36,37,38,39,40,41,42,43,46,49,50,66,68,72,73,74,75,76,77,79,80,83,84,85,86,87,88,],[25,25,-2,-4,-5,-6,-7,-8,-9,25,25,-3,25,-21,25,25,25,25,25,25,25,25,25,25,25,25,25,-10,25,25,-16,-11,25,25,25,25,25,-17,-19,25,25,25,25,-20,-18,]),'FLOAT_NUMBER':([0,2,3,4,5,6,7,8,9,14,24,28,30,31,32,33,34,35,36,37,38,39,40,41,42,43,46,49,50,66,68,72,73,74,75,76,77,79,80,83,84,85,86,87,88,],[26,26,-2,-4,-5,-6,-7,-8,-9,26,26,-3,26,-21,26,26,26,26,26,26,26,26,26,26,26,26,26,-10,26,26,-16,-11,26,26,26,26,26,-17,-19,26,26,26,26,-20,-18,]),'STRING_LITERAL':([0,2,3,4,5,6,7,8,9,14,24,28,30,31,32,33,34,35,36,37,38,39,40,41,42,43,46,49,50,66,68,72,73,74,75,76,77,79,80,83,84,85,86,87,88,],[27,27,-2,-4,-5,-6,-7,-8,-9,27,27,-3,27,-21,27,27,27,27,27,27,27,27,27,27,27,27,27,-10,27,27,-16,-11,27,27,27,27,27,-17,-19,27,27,27,27,-20,-18,]),'LPAREN':([0,2,3,4,5,6,7,8,9,13,14,15,16,24,28,30,31,32,33,34,35,36,37,38,39,40,41,42,43,46,49,50,66,68,72,73,74,75,76,77,79,80,83,84,85,86,87,88,],[14,14,-2,-4,-5,-6,-7,-8,-9,43,14,46,47,14,-3,14,-21,14,14,14,14,14,14,14,14,14,14,14,14,14,-10,14,14,-16,-11,14,14,14,14,14,-17,-19,14,14,14,14,-20,-18,]),'$end':([1,2,3,4,5,6,7,8,9,28,31,49,68,72,79,80,87,88,],[0,-1,-2,-4,-5,-6,-7,-8,-9,-3,-21,-10,-16,-11,-17,-19,-20,-18,]),'RBRACE':([3,4,5,6,7,8,9,28,31,49,68,72,76,77,79,80,85,86,87,88,],[-2,-4,-5,-6,-7,-8,-9,-3,-21,-10,-16,-11,79,80,-17,-19,87,88,-20,-18,]),'ASSIGN':([11,29,],[30,50,]),'SEMICOLON':([11,12,21,22,23,25,26,27,29,45,48,51,52,53,54,55,56,57,58,59,60,61,62,64,67,71,],[-37,31,-22,-23,-24,-38,-39,-40,49,-37,-36,68,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-41,72,75,]),'PLUS':([11,12,21,22,23,25,26,27,44,45,48,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,67,71,78,],[-37,32,-22,-23,-24,-38,-39,-40,32,-37,-36,32,-25,-26,-27,-28,-29,32,32,32,32,32,32,32,-41,32,32,32,32,]),'TIMES':([11,12,21,22,23,25,26,27,44,45,48,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,67,71,78,],[-37,34,-22,-23,-24,-38,-39,-40,34,-37,34,34,34,34,-27,-28,-29,34,34,34,34,34,34,34,-41,34,34,34,34,]),'DIVIDE':([11,12,21,22,23,25,26,27,44,45,48,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,67,71,78,],[-37,35,-22,-23,-24,-38,-39,-40,35,-37,35,35,35,35,-27,-28,-29,35,35,35,35,35,35,35,-41,35,35,35,35,]),'MODULO':([11,12,21,22,23,25,26,27,44,45,48,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,67,71,78,],[-37,36,-22,-23,-24,-38,-39,-40,36,-37,36,36,36,36,-27,-28,-29,36,36,36,36,36,36,36,-41,36,36,36,36,]),'EQ':([11,12,21,22,23,25,26,27,44,45,48,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,67,71,78,],[-37,37,-22,-23,-24,-38,-39,-40,37,-37,-36,37,-25,-26,-27,-28,-29,37,37,37,37,37,37,37,-41,37,37,37,37,]),'NE':([11,12,21,22,23,25,26,27,44,45,48,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,67,71,78,],[-37,38,-22,-23,-24,-38,-39,-40,38,-37,-36,38,-25,-26,-27,-28,-29,38,38,38,38,38,38,38,-41,38,38,38,38,]),'LT':([11,12,21,22,23,25,26,27,44,45,48,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,67,71,78,],[-37,39,-22,-23,-24,-38,-39,-40,39,-37,-36,39,-25,-26,-27,-28,-29,39,39,39,39,39,39,39,-41,39,39,39,39,]),'LE':([11,12,21,22,23,25,26,27,44,45,48,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,67,71,78,],[-37,40,-22,-23,-24,-38,-39,-40,40,-37,-36,40,-25,-26,-27,-28,-29,40,40,40,40,40,40,40,-41,40,40,40,40,]),'GT':([11,12,21,22,23,25,26,27,44,45,48,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,67,71,78,],[-37,41,-22,-23,-24,-38,-39,-40,41,-37,-36,41,-25,-26,-27,-28,-29,41,41,41,41,41,41,41,-41,41,41,41,41,]),'GE':([11,12,21,22,23,25,26,27,44,45,48,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,67,71,78,],[-37,42,-22,-23,-24,-38,-39,-40,42,-37,-36,42,-25,-26,-27,-28,-29,42,42,42,42,42,42,42,-41,42,42,42,42,]),'RPAREN':([21,22,23,25,26,27,44,45,48,52,53,54,55,56,57,58,59,60,61,62,63,64,65,78,],[-22,-23,-24,-38,-39,-40,64,-37,-36,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,69,-41,70,81,]),'LBRACE':([69,70,81,82,],[73,74,83,84,]),'ELSE':([79,],[82,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'statement_list':([0,73,74,83,84,],[2,76,77,85,86,]),'statement':([0,2,73,74,76,77,83,84,85,86,],[3,28,3,3,28,28,3,3,28,28,]),'declaration':([0,2,47,73,74,76,77,83,84,85,86,],[4,4,66,4,4,4,4,4,4,4,4,]),'assignment':([0,2,73,74,76,77,83,84,85,86,],[5,5,5,5,5,5,5,5,5,5,]),'if_statement':([0,2,73,74,76,77,83,84,85,86,],[6,6,6,6,6,6,6,6,6,6,]),'while_statement':([0,2,73,74,76,77,83,84,85,86,],[7,7,7,7,7,7,7,7,7,7,]),'for_statement':([0,2,73,74,76,77,83,84,85,86,],[8,8,8,8,8,8,8,8,8,8,]),'expression_statement':([0,2,73,74,76,77,83,84,85,86,],[9,9,9,9,9,9,9,9,9,9,]),'type':([0,2,47,73,74,76,77,83,84,85,86,],[10,10,10,10,10,10,10,10,10,10,10,]),'expression':([0,2,14,24,30,32,33,34,35,36,37,38,39,40,41,42,43,46,50,66,73,74,75,76,77,83,84,85,86,],[12,12,44,48,51,52,53,54,55,56,57,58,59,60,61,62,63,65,67,71,12,12,78,12,12,12,12,12,12,]),'binary_expression':([0,2,14,24,30,32,33,34,35,36,37,38,39,40,41,42,43,46,50,66,73,74,75,76,77,83,84,85,86,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'unary_expression':([0,2,14,24,30,32,33,34,35,36,37,38,39,40,41,42,43,46,50,66,73,74,75,76,77,83,84,85,86,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'primary_expression':([0,2,14,24,30,32,33,34,35,36,37,38,39,40,41,42,43,46,50,66,73,74,75,76,77,83,84,85,86,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('program -> statement_list','program',1,'p_program','parser.py',30),
+  ('statement_list -> statement','statement_list',1,'p_statement_list','parser.py',34),
+  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','parser.py',35),
+  ('statement -> declaration','statement',1,'p_statement','parser.py',43),
+  ('statement -> assignment','statement',1,'p_statement','parser.py',44),
+  ('statement -> if_statement','statement',1,'p_statement','parser.py',45),
+  ('statement -> while_statement','statement',1,'p_statement','parser.py',46),
+  ('statement -> for_statement','statement',1,'p_statement','parser.py',47),
+  ('statement -> expression_statement','statement',1,'p_statement','parser.py',48),
+  ('declaration -> type ID SEMICOLON','declaration',3,'p_declaration','parser.py',52),
+  ('declaration -> type ID ASSIGN expression SEMICOLON','declaration',5,'p_declaration','parser.py',53),
+  ('type -> INT','type',1,'p_type','parser.py',67),
+  ('type -> FLOAT','type',1,'p_type','parser.py',68),
+  ('type -> STRING','type',1,'p_type','parser.py',69),
+  ('type -> BOOL','type',1,'p_type','parser.py',70),
+  ('assignment -> ID ASSIGN expression SEMICOLON','assignment',4,'p_assignment','parser.py',74),
+  ('if_statement -> IF LPAREN expression RPAREN LBRACE statement_list RBRACE','if_statement',7,'p_if_statement','parser.py',81),
+  ('if_statement -> IF LPAREN expression RPAREN LBRACE statement_list RBRACE ELSE LBRACE statement_list RBRACE','if_statement',11,'p_if_statement','parser.py',82),
+  ('while_statement -> WHILE LPAREN expression RPAREN LBRACE statement_list RBRACE','while_statement',7,'p_while_statement','parser.py',89),
+  ('for_statement -> FOR LPAREN declaration expression SEMICOLON expression RPAREN LBRACE statement_list RBRACE','for_statement',10,'p_for_statement','parser.py',93),
+  ('expression_statement -> expression SEMICOLON','expression_statement',2,'p_expression_statement','parser.py',97),
+  ('expression -> binary_expression','expression',1,'p_expression','parser.py',101),
+  ('expression -> unary_expression','expression',1,'p_expression','parser.py',102),
+  ('expression -> primary_expression','expression',1,'p_expression','parser.py',103),
+  ('binary_expression -> expression PLUS expression','binary_expression',3,'p_binary_expression','parser.py',107),
+  ('binary_expression -> expression MINUS expression','binary_expression',3,'p_binary_expression','parser.py',108),
+  ('binary_expression -> expression TIMES expression','binary_expression',3,'p_binary_expression','parser.py',109),
+  ('binary_expression -> expression DIVIDE expression','binary_expression',3,'p_binary_expression','parser.py',110),
+  ('binary_expression -> expression MODULO expression','binary_expression',3,'p_binary_expression','parser.py',111),
+  ('binary_expression -> expression EQ expression','binary_expression',3,'p_binary_expression','parser.py',112),
+  ('binary_expression -> expression NE expression','binary_expression',3,'p_binary_expression','parser.py',113),
+  ('binary_expression -> expression LT expression','binary_expression',3,'p_binary_expression','parser.py',114),
+  ('binary_expression -> expression LE expression','binary_expression',3,'p_binary_expression','parser.py',115),
+  ('binary_expression -> expression GT expression','binary_expression',3,'p_binary_expression','parser.py',116),
+  ('binary_expression -> expression GE expression','binary_expression',3,'p_binary_expression','parser.py',117),
+  ('unary_expression -> MINUS expression','unary_expression',2,'p_unary_expression','parser.py',121),
+  ('primary_expression -> ID','primary_expression',1,'p_primary_expression','parser.py',125),
+  ('primary_expression -> NUMBER','primary_expression',1,'p_primary_expression','parser.py',126),
+  ('primary_expression -> FLOAT_NUMBER','primary_expression',1,'p_primary_expression','parser.py',127),
+  ('primary_expression -> STRING_LITERAL','primary_expression',1,'p_primary_expression','parser.py',128),
+  ('primary_expression -> LPAREN expression RPAREN','primary_expression',3,'p_primary_expression','parser.py',129),
+]
@@ -0,0 +1,171 @@
+"""Single-pass analysis: parse each snippet once and walk its AST once.
+
+One walk per tree produces everything the separate compare, semantic and
+visualization calls used to compute with their own traversals: the
+normalized copy, subtree sizes, structural hashes, semantic checks, the
+graph elements for the DOT output and the SubtreeIndex used for clone
+detection.
+"""
+from copy import copy
+
+from .ast_compare import ASTNormalizer, similarity_score, tree_edit_distance
+from .clones import SubtreeIndex, find_clones, subtree_hash
+from .graphviz_utils import node_label
+from .parser import parse_code
+from .semantic import SemanticAnalyzer, analyze_semantics
+from .token_compare import coverage_similarity, greedy_string_tiling, normalize_tokens
+
+
+def analyze_tree(ast):
+    """Walk an AST once and return its normalized copy, sizes, hashes, semantics, graph elements and clone index"""
+    if ast is None:
+        return {
+            'normalized': None,
+            'index': None,
+            'sizes': {},
+            'hashes': {},
+            'size': 0,
+            'hash': None,
+            'semantics': analyze_semantics(None),
+            'elements': [],
+        }
+
+    normalizer = ASTNormalizer()
+    analyzer = SemanticAnalyzer()
+    # Sizes and hashes of the source tree, for find_clones
+    index = SubtreeIndex()
+    # Sizes and hashes of the normalized copy, for tree_edit_distance
+    sizes = {}
+    hashes = {}
+    elements = []
+    # Source nodes the semantic analyzer still has to visit
+    pending_semantic = {id(ast)}
+
+    root = []
+    # Entries are (source, parent source, children list of the parent copy, copy);
+    # a copy is only present on the exit entry pushed after its children.
+    stack = [(ast, None, root, None)]
+    while stack:
+        source, parent, siblings, normalized_node = stack.pop()
+
+        if normalized_node is not None:
+            # Exit: every child has been sized and hashed
+            index.exit(source)
+            sizes[id(normalized_node)] = index.sizes[id(source)]
+            hashes[id(normalized_node)] = subtree_hash(
+                normalized_node, [hashes[id(child)] for child in normalized_node.children if child is not None])
+            continue
+
+        if source is None:
+            siblings.append(None)
+            continue
+
+        # Enter: index, normalize, check semantics and record the graph entry
+        index.enter(source, parent, len(siblings))
+        normalized_node = copy(source)
+        normalizer.normalize_value(normalized_node)
+        normalized_node.children = []
+        siblings.append(normalized_node)
+
+        if id(source) in pending_semantic:
+            pending_semantic.discard(id(source))
+            for child in analyzer.visit(source):
+                if child is not None:
+                    pending_semantic.add(id(child))
+
+        elements.append((
+            str(id(source)),
+            node_label(source),
+            str(id(parent)) if parent is not None else None,
+        ))
+
+        stack.append((source, parent, siblings, normalized_node))
+        for child in reversed(source.children):
+            stack.append((child, source, normalized_node.children, None))
+
+    analyzer.check_unused_variables()
+    normalized_root = root[0]
+    return {
+        'normalized': normalized_root,
+        'index': index,
+        'sizes': sizes,
+        'hashes': hashes,
+        'size': sizes[id(normalized_root)],
+        'hash': hashes[id(normalized_root)],
+        'semantics': {
+            'errors': analyzer.errors,
+            'warnings': analyzer.warnings,
+            'symbol_table': analyzer.symbol_table
+        },
+        'elements': elements,
+    }
+
+
+def analyze_code(code1, code2):
+    """Compare two code snippets and analyze both of them in one pass per tree"""
+    try:
+        ast1 = parse_code(code1)
+        ast2 = parse_code(code2)
+
+        tree1 = analyze_tree(ast1)
+        tree2 = analyze_tree(ast2)
+
+        similarity = 0.0
+        if tree1['size'] and tree2['size']:
+            distance = tree_edit_distance(
+                tree1['normalized'], tree2['normalized'],
+                sizes={**tree1['sizes'], **tree2['sizes']},
+                hashes={**tree1['hashes'], **tree2['hashes']},
+            )
+            similarity = similarity_score(distance, tree1['size'], tree2['size'])
+
+        return {
+            'similarity': similarity,
+            'ast1': ast1,
+            'ast2': ast2,
+            'clones': find_clones(ast1, ast2, index1=tree1['index'], index2=tree2['index']),
+            'tree1': tree1,
+            'tree2': tree2
+        }
+    except Exception as e:
+        print(f"Error analyzing code: {e}")
+        return {
+            'similarity': 0.0,
+            'ast1': None,
+            'ast2': None,
+            'clones': [],
+            'error': str(e)
+        }
+
+
+def similarity_matrix(codes, mode='ast'):
+    """Pairwise similarity of many snippets as the row-major upper triangle (i < j)
+
+    Each snippet is parsed (or tokenized) and normalized once, however many
+    pairs it takes part in.
+    """
+    upper_triangle = []
+    if mode == 'tokens':
+        streams = [normalize_tokens(code)[0] for code in codes]
+        for i in range(len(streams)):
+            for j in range(i + 1, len(streams)):
+                tiles = greedy_string_tiling(streams[i], streams[j])
+                upper_triangle.append(coverage_similarity(streams[i], streams[j], tiles))
+        return upper_triangle
+    if mode != 'ast':
+        raise ValueError(f"Unknown comparison mode '{mode}'")
+
+    trees = [analyze_tree(parse_code(code)) for code in codes]
+    for i in range(len(trees)):
+        for j in range(i + 1, len(trees)):
+            tree1, tree2 = trees[i], trees[j]
+            similarity = 0.0
+            if tree1['size'] and tree2['size']:
+                distance = tree_edit_distance(
+                    tree1['normalized'], tree2['normalized'],
+                    sizes={**tree1['sizes'], **tree2['sizes']},
+                    hashes={**tree1['hashes'], **tree2['hashes']},
+                )
+                similarity = similarity_score(distance, tree1['size'], tree2['size'])
+            upper_triangle.append(similarity)
+    return upper_triangle
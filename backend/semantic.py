@@ -1,93 +1,158 @@
+from array import array
+
+
+class SymbolTable:
+    """Declarations stored column-wise in compact arrays.
+
+    Row i is the i-th declaration: its name, an index into the table's type
+    names and its used/initialized flags. Results that are kept around, such
+    as the batch cache, hold this form; to_dict builds the symbol_table dict
+    returned by analyze_semantics.
+    """
+
+    def __init__(self, scope="global"):
+        self.scope = scope
+        self.names = []
+        self.type_names = []
+        self.type_ids = array('B')
+        self.used = array('B')
+        self.initialized = array('B')
+
+    def declare(self, name, var_type, initialized):
+        """Add a declaration and return its row"""
+        try:
+            type_id = self.type_names.index(var_type)
+        except ValueError:
+            type_id = len(self.type_names)
+            self.type_names.append(var_type)
+        self.names.append(name)
+        self.type_ids.append(type_id)
+        self.used.append(0)
+        self.initialized.append(1 if initialized else 0)
+        return len(self.names) - 1
+
+    def mark_used(self, row):
+        self.used[row] = 1
+
+    def __len__(self):
+        return len(self.names)
+
+    def rows(self):
+        """(name, type, used, initialized) for every declaration in order"""
+        type_names = self.type_names
+        for name, type_id, used, initialized in zip(self.names, self.type_ids, self.used, self.initialized):
+            yield name, type_names[type_id], bool(used), bool(initialized)
+
+    def to_dict(self):
+        """Name -> {type, used, scope, initialized}"""
+        scope = self.scope
+        return {
+            name: {'type': var_type, 'used': used, 'scope': scope, 'initialized': initialized}
+            for name, var_type, used, initialized in self.rows()
+        }
+
+
 class SemanticAnalyzer:
     def __init__(self):
-        self.symbol_table = {}
         self.current_scope = "global"
+        self.symbols = SymbolTable(self.current_scope)
+        # name -> row of its declaration in symbols
+        self.declared = {}
         self.errors = []
         self.warnings = []
 
+    @property
+    def symbol_table(self):
+        return self.symbols.to_dict()
+
     def analyze(self, node):
-        if node is None:
-            return
-            
-        if hasattr(node, 'type'):
-            if node.type == 'program':
-                for child in node.children:
-                    self.analyze(child)
-            elif node.type == 'statement_list':
-                for child in node.children:
-                    self.analyze(child)
-            elif node.type == 'declaration':
-                if len(node.children) >= 2:
-                    var_type = node.children[0].value
-                    var_name = node.children[1].value
-                    if var_name in self.symbol_table:
-                        self.errors.append(f"Redeclaration of variable '{var_name}'")
-                    else:
-                        self.symbol_table[var_name] = {
-                            'type': var_type,
-                            'used': False,
-                            'scope': self.current_scope,
-                            'initialized': len(node.children) > 2
-                        }
-                        if len(node.children) > 2:  # Has initialization
-                            self.analyze(node.children[2])
-            elif node.type == 'assignment':
-                if len(node.children) >= 2:
-                    var_name = node.children[0].value
-                    if var_name not in self.symbol_table:
-                        self.errors.append(f"Undeclared variable '{var_name}'")
-                    else:
-                        self.symbol_table[var_name]['used'] = True
-                        self.analyze(node.children[1])
-            elif node.type == 'identifier':
-                if hasattr(node, 'value') and node.value in self.symbol_table:
-                    self.symbol_table[node.value]['used'] = True
-                elif hasattr(node, 'value'):
+        # Walk the tree in preorder with an explicit stack; each visit
+        # returns the children that still need to be analyzed, in order.
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current is None:
+                continue
+            stack.extend(reversed(self.visit(current)))
+
+    def visit(self, node):
+        """Check a single node and return the children to analyze next"""
+        if not hasattr(node, 'type'):
+            return []
+        
+        if node.type == 'program':
+            return node.children
+        elif node.type == 'statement_list':
+            return node.children
+        elif node.type == 'declaration':
+            if len(node.children) >= 2:
+                var_type = node.children[0].value
+                var_name = node.children[1].value
+                if var_name in self.declared:
+                    self.errors.append(f"Redeclaration of variable '{var_name}'")
+                else:
+                    self.declared[var_name] = self.symbols.declare(var_name, var_type, len(node.children) > 2)
+                    if len(node.children) > 2:  # Has initialization
+                        return [node.children[2]]
+        elif node.type == 'assignment':
+            if len(node.children) >= 2:
+                var_name = node.children[0].value
+                row = self.declared.get(var_name)
+                if row is None:
+                    self.errors.append(f"Undeclared variable '{var_name}'")
+                else:
+                    self.symbols.mark_used(row)
+                    return [node.children[1]]
+        elif node.type == 'identifier':
+            if hasattr(node, 'value'):
+                row = self.declared.get(node.value)
+                if row is not None:
+                    self.symbols.mark_used(row)
+                else:
                     self.errors.append(f"Undeclared variable '{node.value}'")
-            elif node.type in ['binary', 'unary']:
-                for child in node.children:
-                    self.analyze(child)
-            elif node.type == 'if':
-                if len(node.children) >= 2:
-                    self.analyze(node.children[0])  # condition
-                    self.analyze(node.children[1])  # then block
-                    if len(node.children) > 2:  # else block
-                        self.analyze(node.children[2])
-            elif node.type == 'while':
-                if len(node.children) >= 2:
-                    self.analyze(node.children[0])  # condition
-                    self.analyze(node.children[1])  # body
-            elif node.type == 'for':
-                # Analyze initialization, condition, increment, body
-                for child in node.children:
-                    self.analyze(child)
-            else:
-                # Recursively analyze all children for unknown node types
-                for child in node.children:
-                    self.analyze(child)
+        elif node.type in ['binary', 'unary']:
+            return node.children
+        elif node.type == 'if':
+            if len(node.children) >= 2:
+                # condition, then block and optional else block
+                return node.children[:3]
+        elif node.type == 'while':
+            if len(node.children) >= 2:
+                return node.children[:2]  # condition, body
+        elif node.type == 'for':
+            # Analyze initialization, condition, increment, body
+            return node.children
+        else:
+            # Analyze all children for unknown node types
+            return node.children
+        return []
 
     def check_unused_variables(self):
-        for var_name, info in self.symbol_table.items():
-            if not info['used']:
+        symbols = self.symbols
+        for var_name, used, initialized in zip(symbols.names, symbols.used, symbols.initialized):
+            if not used:
                 self.warnings.append(f"Unused variable '{var_name}'")
-            if not info.get('initialized', True):
+            if not initialized:
                 self.warnings.append(f"Variable '{var_name}' declared but not initialized")
 
-def analyze_semantics(ast):
-    """Analyze semantics of an AST and return errors, warnings, and symbol table"""
+def check_semantics(ast):
+    """Analyze an AST and return (errors, warnings, SymbolTable) without building the symbol_table dict"""
     if ast is None:
-        return {
-            'errors': ['No AST provided for semantic analysis'],
-            'warnings': [],
-            'symbol_table': {}
-        }
-    
+        return ['No AST provided for semantic analysis'], [], SymbolTable()
+
     analyzer = SemanticAnalyzer()
     analyzer.analyze(ast)
     analyzer.check_unused_variables()
-    
+    return analyzer.errors, analyzer.warnings, analyzer.symbols
+
+def semantics_to_dict(errors, warnings, symbols):
+    """Result dict of analyze_semantics for a check_semantics result"""
     return {
-        'errors': analyzer.errors,
-        'warnings': analyzer.warnings,
-        'symbol_table': analyzer.symbol_table
+        'errors': errors,
+        'warnings': warnings,
+        'symbol_table': symbols.to_dict()
     }
+
+def analyze_semantics(ast):
+    """Analyze semantics of an AST and return errors, warnings, and symbol table"""
+    return semantics_to_dict(*check_semantics(ast))
@@ -0,0 +1,139 @@
+"""Semantic analysis of many submissions at once, for class-wide lint runs.
+
+Results are cached by a hash of the source, so resubmitted or duplicated
+code is only parsed and analyzed once. The cache holds the compact
+(errors, warnings, SymbolTable) results of check_semantics; callers build
+the symbol_table dict with semantics_to_dict only when they respond.
+Sources that miss the cache are deduplicated and spread over a pool of
+worker processes; small batches are analyzed inline, where starting the
+pool would cost more than it saves.
+"""
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import blake2b
+
+from .parser import parse_code
+from .semantic import check_semantics
+
+# Results kept in memory; override with SEMANTIC_CACHE_SIZE
+DEFAULT_CACHE_SIZE = 4096
+
+# Fewer uncached sources than this are analyzed in the calling process
+MIN_POOL_BATCH = 8
+
+
+def source_hash(code):
+    """Cache key of a submission's source text"""
+    return blake2b(code.encode(), digest_size=16).digest()
+
+
+def analyze_source(code):
+    """Parse and check one submission; returns (errors, warnings, SymbolTable)"""
+    return check_semantics(parse_code(code))
+
+
+def _analyze_chunk(codes):
+    return [analyze_source(code) for code in codes]
+
+
+class SemanticCache:
+    """Least-recently-used map from source hash to analysis result"""
+
+    def __init__(self, max_entries=DEFAULT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            result = self.entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key, result):
+        with self.lock:
+            self.entries[key] = result
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def stats(self):
+        with self.lock:
+            return {'entries': len(self.entries), 'hits': self.hits, 'misses': self.misses}
+
+
+class SemanticBatch:
+    """Cached semantic analysis over a lazily started process pool"""
+
+    def __init__(self, workers=None, cache_size=None):
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if cache_size is None:
+            cache_size = int(os.environ.get('SEMANTIC_CACHE_SIZE', DEFAULT_CACHE_SIZE))
+        self.workers = max(1, workers)
+        self.cache = SemanticCache(cache_size)
+        self.pool = None
+        self.pool_lock = threading.Lock()
+
+    def _get_pool(self):
+        with self.pool_lock:
+            if self.pool is None:
+                context = multiprocessing.get_context('spawn')
+                self.pool = ProcessPoolExecutor(self.workers, mp_context=context)
+            return self.pool
+
+    def _run(self, codes):
+        if self.workers == 1 or len(codes) < MIN_POOL_BATCH:
+            return _analyze_chunk(codes)
+        # A few chunks per worker keeps the pipes busy without one slow
+        # chunk holding up the whole batch
+        chunk_size = max(1, len(codes) // (self.workers * 4))
+        chunks = [codes[i:i + chunk_size] for i in range(0, len(codes), chunk_size)]
+        results = []
+        for chunk_results in self._get_pool().map(_analyze_chunk, chunks):
+            results.extend(chunk_results)
+        return results
+
+    def analyze(self, codes):
+        """check_semantics results for codes, in order"""
+        keys = [source_hash(code) for code in codes]
+        results = {}
+        pending = {}
+        for key, code in zip(keys, codes):
+            if key in results or key in pending:
+                continue
+            cached = self.cache.get(key)
+            if cached is not None:
+                results[key] = cached
+            else:
+                pending[key] = code
+
+        if pending:
+            for key, result in zip(pending, self._run(list(pending.values()))):
+                self.cache.put(key, result)
+                results[key] = result
+        return [results[key] for key in keys]
+
+    def stats(self):
+        return {'workers': self.workers, **self.cache.stats()}
+
+    def close(self):
+        with self.pool_lock:
+            if self.pool is not None:
+                self.pool.shutdown()
+                self.pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
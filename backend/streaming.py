@@ -0,0 +1,180 @@
+"""Bounded-memory analysis of very large source files.
+
+The input is read line by line and cut at top-level statement boundaries.
+Each statement is parsed, normalized and summarized on its own, and only the
+summary is handed on: the full program tree is never built, so memory use
+depends on the largest statement rather than on the size of the file.
+Statements longer than MAX_STATEMENT_CHARS, and unbalanced braces or
+parentheses, are reported as error summaries and skipped.
+
+    python -m backend.streaming submission.c > statements.jsonl
+"""
+import json
+import sys
+
+from .ast_compare import ASTNormalizer
+from .clones import MIN_CLONE_SIZE, SubtreeIndex
+from .lexer import lexer, lexer_lock
+from .parser import parse_code
+
+# Longest statement, in characters, that stream_statements buffers; anything
+# longer (usually an unclosed brace) is reported and skipped
+MAX_STATEMENT_CHARS = 1 << 20
+
+
+def iter_statements(lines, return_errors=False, max_chars=None):
+    """Yield (text, first line) for each top-level statement in an iterable of lines
+
+    Tokens never span lines, so each line is lexed on its own while brace and
+    parenthesis depth carry over. A block closed at depth 0 only ends the
+    statement if the next token is not `else`. Raises ValueError when braces
+    or parentheses do not balance, or when a statement grows past max_chars.
+
+    With return_errors, the ValueError is yielded in place of the text
+    instead and splitting resumes at the top level: after the offending
+    token for an unbalanced close, or at the next line for an overlong
+    statement.
+    """
+    with lexer_lock:
+        scanner = lexer.clone()
+    braces = parens = 0
+    pending = []
+    pending_chars = 0
+    start_line = None
+    # Text of an if/while/for statement whose block just closed at depth 0
+    closed_text = None
+
+    for lineno, line in enumerate(lines, start=1):
+        scanner.lineno = lineno
+        scanner.input(line)
+        offset = 0
+        while True:
+            tok = scanner.token()
+            if tok is None:
+                break
+
+            if closed_text is not None:
+                if tok.type == 'ELSE':
+                    pending.insert(0, closed_text)
+                    pending_chars = len(closed_text)
+                else:
+                    yield closed_text, start_line
+                    start_line = None
+                closed_text = None
+
+            if start_line is None:
+                # Drop whitespace and comments between statements
+                pending = []
+                pending_chars = 0
+                offset = tok.lexpos
+                start_line = lineno
+
+            if tok.type == 'LBRACE':
+                braces += 1
+            elif tok.type == 'RBRACE':
+                braces -= 1
+                if braces == 0 and parens == 0:
+                    closed_text = ''.join(pending) + line[offset:tok.lexpos + 1]
+                    pending = []
+                    pending_chars = 0
+                    offset = tok.lexpos + 1
+            elif tok.type == 'LPAREN':
+                parens += 1
+            elif tok.type == 'RPAREN':
+                parens -= 1
+            elif tok.type == 'SEMICOLON' and braces == 0 and parens == 0:
+                yield ''.join(pending) + line[offset:tok.lexpos + 1], start_line
+                pending = []
+                pending_chars = 0
+                start_line = None
+                offset = tok.lexpos + 1
+
+            if braces < 0 or parens < 0:
+                error = ValueError(f"Unbalanced braces or parentheses at line {lineno}")
+                if not return_errors:
+                    raise error
+                yield error, start_line if start_line is not None else lineno
+                braces = parens = 0
+                pending = []
+                pending_chars = 0
+                start_line = None
+                offset = tok.lexpos + 1
+
+        if start_line is not None:
+            pending.append(line[offset:])
+            pending_chars += len(line) - offset
+            if max_chars is not None and pending_chars > max_chars:
+                error = ValueError(f"Statement at line {start_line} is longer than {max_chars} characters")
+                if not return_errors:
+                    raise error
+                yield error, start_line
+                braces = parens = 0
+                pending = []
+                pending_chars = 0
+                start_line = None
+
+    if closed_text is not None:
+        yield closed_text, start_line
+    elif start_line is not None or braces or parens:
+        error = ValueError("Incomplete statement at end of input")
+        if not return_errors:
+            raise error
+        yield error, start_line
+
+
+def stream_statements(lines, min_size=MIN_CLONE_SIZE, max_chars=MAX_STATEMENT_CHARS):
+    """Parse and normalize a source stream statement by statement
+
+    Yields one summary per top-level statement: its line range and size,
+    the hash of its normalized subtree and the fingerprints (shape hashes
+    of subtrees with at least ``min_size`` nodes) used for clone matching.
+    Variable numbering carries over between statements exactly as it does
+    when the whole program is normalized at once. Unbalanced or overlong
+    statements get an error summary and the stream carries on after them.
+    """
+    normalizer = ASTNormalizer()
+    index = 0
+    for text, first_line in iter_statements(lines, return_errors=True, max_chars=max_chars):
+        if isinstance(text, ValueError):
+            yield {'index': index, 'lines': [first_line, None], 'error': str(text)}
+            index += 1
+            continue
+
+        ast = parse_code(text, first_line)
+        if ast is None or not ast.children or ast.children[0].type != 'statement_list':
+            yield {'index': index, 'lines': [first_line, None], 'error': 'Syntax error'}
+            index += 1
+            continue
+
+        for statement in ast.children[0].children:
+            # Normalizing only renames identifiers and blanks literals, which
+            # shape hashes ignore, so one index of the copy gives both hashes
+            subtrees = SubtreeIndex(normalizer.normalize(statement))
+            root = subtrees.order[0]
+            fingerprints = [
+                subtrees.shape_hashes[key].hex()
+                for key in subtrees.order if subtrees.sizes[key] >= min_size
+            ]
+            yield {
+                'index': index,
+                'type': statement.type,
+                'lines': [statement.lineno, statement.end_lineno],
+                'size': subtrees.sizes[root],
+                'hash': subtrees.exact_hashes[root].hex(),
+                'fingerprints': fingerprints
+            }
+            index += 1
+
+
+def stream_file(path, min_size=MIN_CLONE_SIZE):
+    """Stream statement summaries for a source file without loading it whole"""
+    with open(path, encoding='utf-8') as source:
+        yield from stream_statements(source, min_size)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python -m backend.streaming <source file>")
+        sys.exit(1)
+    for summary in stream_file(sys.argv[1]):
+        print(json.dumps(summary))
@@ -0,0 +1,47 @@
+"""Non-recursive tree walkers shared by the backend passes.
+
+ASTs built from long statement lists or deeply nested blocks easily exceed
+Python's recursion limit, so every pass walks the tree with an explicit
+stack instead of recursing.
+"""
+
+
+def preorder(root):
+    """Yield (node, parent) pairs depth-first, left to right"""
+    if root is None:
+        return
+    stack = [(root, None)]
+    while stack:
+        node, parent = stack.pop()
+        yield node, parent
+        children = getattr(node, 'children', None)
+        if children:
+            for child in reversed(children):
+                if child is not None:
+                    stack.append((child, node))
+
+
+def postorder(root):
+    """Return the nodes of a tree as a list with every child before its parent"""
+    if root is None:
+        return []
+    order = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        for child in node.children:
+            if child is not None:
+                stack.append(child)
+    # Reversed (node, right-to-left children) order puts children first
+    order.reverse()
+    return order
+
+
+def subtree_sizes(*roots):
+    """Map id(node) -> number of nodes in its subtree for every node of the given trees"""
+    sizes = {}
+    for root in roots:
+        for node in postorder(root):
+            sizes[id(node)] = 1 + sum(sizes[id(child)] for child in node.children if child is not None)
+    return sizes
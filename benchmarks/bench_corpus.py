@@ -0,0 +1,55 @@
+"""Load a synthetic corpus into the sharded index and time queries.
+
+Runs the whole index locally for each shard count, so it doubles as an
+end-to-end check of the scatter-gather path.
+
+    python benchmarks/bench_corpus.py [--submissions 400] [--shards 1,2,4]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.corpus import ShardedIndex
+from synthetic import make_submission
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--submissions", type=int, default=400)
+    arg_parser.add_argument("--queries", type=int, default=20)
+    arg_parser.add_argument("--shards", default="1,2,4")
+    args = arg_parser.parse_args()
+
+    rng = random.Random(7)
+    corpus = {f"sub{i}": make_submission(rng) for i in range(args.submissions)}
+    # Queries are copies of stored submissions, so each should find itself
+    queries = rng.sample(sorted(corpus), args.queries)
+
+    print(f"{'shards':>6} {'load s':>8} {'p50 query ms':>13} {'max query ms':>13} {'self hits':>10}")
+    for shard_count in (int(value) for value in args.shards.split(",")):
+        with ShardedIndex(shard_count) as index:
+            start = time.perf_counter()
+            for submission_id, code in corpus.items():
+                index.add(submission_id, code)
+            load = time.perf_counter() - start
+
+            timings = []
+            hits = 0
+            for submission_id in queries:
+                start = time.perf_counter()
+                results = index.query(corpus[submission_id], k=5)
+                timings.append((time.perf_counter() - start) * 1000)
+                hits += any(result['id'] == submission_id for result in results)
+
+        print(f"{shard_count:>6} {load:>8.2f} {statistics.median(timings):>13.1f} "
+              f"{max(timings):>13.1f} {hits:>5}/{len(queries)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""Time and memory of a class-wide semantic lint run.
+
+Generates a class of synthetic submissions (some of them resubmitted
+unchanged) and parses them up front. Reports the wall time, the memory
+still held by the results and the tracemalloc peak of checking every tree
+into the symbol_table dicts of analyze_semantics and into the compact
+SymbolTable of check_semantics, then of a cold and a warm SemanticBatch
+run, which include parsing. The warm run should only pay for the cache
+lookups.
+
+    python benchmarks/bench_semantic.py [--submissions 200] [--workers 2]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.parser import parse_code
+from backend.semantic import analyze_semantics, check_semantics
+from backend.semantic_batch import SemanticBatch
+
+
+def make_class(submissions, duplicates=0.2):
+    """Synthetic submissions; a share of them repeat an earlier one"""
+    codes = []
+    for i in range(submissions):
+        if codes and i % int(1 / duplicates) == 0:
+            codes.append(codes[i // 2])
+            continue
+        lines = []
+        for j in range(40 + i % 30):
+            lines.append(f"int v{j} = {i + j};")
+            if j % 4 == 1:
+                lines.append(f"while (v{j} < {i}) {{\n    v{j} = v{j} + v{j - 1};\n}}")
+        codes.append("\n".join(lines) + "\n")
+    return codes
+
+
+def measure(func, *args):
+    """Seconds, KiB retained by the result and peak KiB of func(*args)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, retained / 1024, peak / 1024
+
+
+def as_dicts(asts):
+    return [analyze_semantics(ast) for ast in asts]
+
+
+def as_tables(asts):
+    return [check_semantics(ast) for ast in asts]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--submissions", type=int, default=200)
+    arg_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = arg_parser.parse_args()
+
+    codes = make_class(args.submissions)
+    asts = [parse_code(code) for code in codes]
+    print(f"{'run':>12} {'seconds':>8} {'held KiB':>9} {'peak KiB':>9}")
+    for run, func, argument in (("dicts", as_dicts, asts), ("tables", as_tables, asts)):
+        elapsed, retained, peak = measure(func, argument)
+        print(f"{run:>12} {elapsed:>8.2f} {retained:>9.0f} {peak:>9.0f}")
+    with SemanticBatch(workers=args.workers) as batch:
+        for run in ("batch cold", "batch warm"):
+            elapsed, retained, peak = measure(batch.analyze, codes)
+            print(f"{run:>12} {elapsed:>8.2f} {retained:>9.0f} {peak:>9.0f}")
+        print(batch.stats())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""Measure cold import time of the backend modules.
+
+Each sample runs in a fresh interpreter, so the number reflects what a
+worker or CLI invocation pays before it can parse anything.
+
+    python benchmarks/bench_startup.py [--runs N] [--budget-ms MS]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = ("backend.ast_compare", "backend.semantic", "backend.graphviz_utils")
+
+TIMER = (
+    "import time; t = time.perf_counter(); "
+    "{imports}"
+    "print((time.perf_counter() - t) * 1000)"
+)
+
+
+def time_import(modules):
+    """Return the import time in milliseconds measured in a new interpreter"""
+    imports = "".join(f"import {name}; " for name in modules)
+    out = subprocess.run(
+        [sys.executable, "-c", TIMER.format(imports=imports)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--runs", type=int, default=10)
+    arg_parser.add_argument("--budget-ms", type=float, default=100.0)
+    args = arg_parser.parse_args()
+
+    samples = [time_import(MODULES) for _ in range(args.runs)]
+    median = statistics.median(samples)
+    print(f"cold import of {', '.join(MODULES)}")
+    print(f"  median {median:.1f} ms  min {min(samples):.1f} ms  max {max(samples):.1f} ms")
+
+    # Heavy optional dependencies must not be pulled in at import time
+    probe = "import sys; " + "".join(f"import {m}; " for m in MODULES) + \
+        "print('graphviz' in sys.modules)"
+    leaked = subprocess.run([sys.executable, "-c", probe], cwd=ROOT,
+                            capture_output=True, text=True, check=True).stdout.strip()
+    if leaked == "True":
+        print("FAIL: graphviz imported at module load")
+        return 1
+
+    if median > args.budget_ms:
+        print(f"FAIL: over the {args.budget_ms:.0f} ms budget")
+        return 1
+    print(f"OK: within the {args.budget_ms:.0f} ms budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""Peak memory of whole-file parsing versus the streaming mode.
+
+Generates synthetic sources of growing size, then reports the tracemalloc
+peak for parse_code + full analysis and for stream_statements. The
+streaming peak should stay roughly flat as the input grows.
+
+    python benchmarks/bench_streaming.py [--sizes 1000,4000,16000]
+"""
+import argparse
+import io
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.parser import parse_code
+from backend.pipeline import analyze_tree
+from backend.streaming import stream_statements
+
+
+def make_source(statements):
+    """Synthetic generated-looking source with a few statement shapes"""
+    lines = []
+    for i in range(statements):
+        if i % 3 == 0:
+            lines.append(f"int v{i % 50} = v{i % 50} * {i} + 3;")
+        elif i % 3 == 1:
+            lines.append(f"while (x < {i}) {{\n    x = x + {i};\n}}")
+        else:
+            lines.append(f"if (x > {i}) {{ x = x - 1; }} else {{ x = x + 2; }}")
+    return "\n".join(lines) + "\n"
+
+
+def peak_kib(func, *args):
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def whole_file(source):
+    analyze_tree(parse_code(source.getvalue()))
+
+
+def streaming(source):
+    count = 0
+    for _ in stream_statements(source):
+        count += 1
+    return count
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--sizes", default="1000,4000,16000")
+    args = arg_parser.parse_args()
+
+    print(f"{'statements':>10} {'source KiB':>11} {'whole KiB':>10} {'stream KiB':>11}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        text = make_source(size)
+        whole = peak_kib(whole_file, io.StringIO(text))
+        stream = peak_kib(streaming, io.StringIO(text))
+        print(f"{size:>10} {len(text) / 1024:>11.0f} {whole:>10.0f} {stream:>11.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
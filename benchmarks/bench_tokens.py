@@ -0,0 +1,86 @@
+"""Time the token engine against the AST engine on growing inputs.
+
+Greedy String Tiling should grow roughly linearly with the number of
+statements; the AST engine is included for the smaller sizes only. Empty
+and very short snippets are compared first, and the run stops if token mode
+reports an error for them.
+
+    python benchmarks/bench_tokens.py [--sizes 250,500,1000,2000,4000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.ast_compare import compare_code
+
+# The AST engine is quadratic; skip it above this many statements
+AST_LIMIT = 250
+
+
+def make_snippet(statements, seed):
+    """Synthetic submission mixing a handful of statement shapes"""
+    rng = random.Random(seed)
+    lines = []
+    for i in range(statements):
+        pick = rng.random()
+        if pick < 0.3:
+            lines.append(f"int v{i} = v{i} * {i} + 3;")
+        elif pick < 0.5:
+            lines.append(f"while (x < {i}) {{ x = x + {i}; }}")
+        elif pick < 0.7:
+            lines.append("if (a > b) { a = a - (b * 2); } else { b = b + 1; }")
+        elif pick < 0.85:
+            lines.append(f"float f{i} = 1.5 / -x;")
+        else:
+            lines.append(f"x = (x + y) % {i} - z;")
+    return "\n".join(lines)
+
+
+# Inputs shorter than the minimum match length, which must give 0% and no tiles
+EDGE_CASES = [
+    ("", ""),
+    ("int x;", "int y;"),
+    ("int x;", make_snippet(20, 3)),
+    ("x = 1;", "x = 1;"),
+]
+
+
+def check_edge_cases():
+    for code1, code2 in EDGE_CASES:
+        result = compare_code(code1, code2, 'tokens')
+        if 'error' in result or result['tiles'] or result['similarity'] != 0.0:
+            raise SystemExit(f"token mode failed on {code1!r} vs {code2[:20]!r}: {result}")
+
+
+def timed(mode, code1, code2):
+    start = time.perf_counter()
+    result = compare_code(code1, code2, mode)
+    return time.perf_counter() - start, result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--sizes", default="250,500,1000,2000,4000")
+    args = arg_parser.parse_args()
+
+    check_edge_cases()
+    print(f"{'statements':>10} {'tokens ms':>10} {'tiles':>6} {'token %':>8} {'ast ms':>10} {'ast %':>8}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        code1 = make_snippet(size, 1)
+        code2 = make_snippet(size, 2)
+        token_time, token_result = timed('tokens', code1, code2)
+        row = (f"{size:>10} {token_time * 1000:>10.1f} {len(token_result['tiles']):>6} "
+               f"{token_result['similarity']:>8.2f}")
+        if size <= AST_LIMIT:
+            ast_time, ast_result = timed('ast', code1, code2)
+            row += f" {ast_time * 1000:>10.1f} {ast_result['similarity']:>8.2f}"
+        print(row)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""Load-test the FastAPI service and report throughput and latency percentiles.
+
+Requests are sent either in-process through an ASGI transport (default) or
+to a running server with --url. Snippet sizes and endpoints are drawn from
+configurable weighted mixes; each run can be appended to a JSON lines file
+so runs with different settings or uvicorn worker counts can be compared.
+
+    python benchmarks/load_test.py --concurrency 8 --requests 200
+    python benchmarks/load_test.py --url http://localhost:8000 --label workers=4 --save runs.jsonl
+    python benchmarks/load_test.py --report runs.jsonl
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synthetic import make_submission
+
+# Statements per generated snippet for each size class
+SIZES = {'small': 8, 'medium': 30, 'large': 80}
+
+ENDPOINTS = ('compare', 'semantic', 'analyze')
+
+
+def parse_mix(text, allowed):
+    """Parse 'name:weight,name:weight' into a {name: weight} dict"""
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition(':')
+        name = name.strip()
+        if name not in allowed:
+            raise argparse.ArgumentTypeError(f"unknown entry '{name}', expected one of {', '.join(allowed)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def make_request(rng, endpoints, sizes):
+    """Pick an endpoint and snippet size from the mixes and build the request"""
+    endpoint = rng.choices(list(endpoints), weights=list(endpoints.values()))[0]
+    size = rng.choices(list(sizes), weights=list(sizes.values()))[0]
+    statements = SIZES[size]
+    if endpoint == 'semantic':
+        body = {'code': make_submission(rng, statements)}
+    else:
+        body = {'code1': make_submission(rng, statements), 'code2': make_submission(rng, statements)}
+    return endpoint, size, f"/api/{endpoint}", body
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(samples, elapsed):
+    """Throughput, error rate and latency percentiles (ms) for a list of samples"""
+    latencies = [sample['latency'] * 1000 for sample in samples if sample['ok']]
+    errors = sum(1 for sample in samples if not sample['ok'])
+    return {
+        'requests': len(samples),
+        'errors': errors,
+        'error_rate': errors / len(samples) if samples else 0.0,
+        'throughput': len(samples) / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(latencies, 0.50),
+        'p95_ms': percentile(latencies, 0.95),
+        'p99_ms': percentile(latencies, 0.99),
+    }
+
+
+async def run_load(client, requests, concurrency):
+    """Send the prepared requests with at most `concurrency` in flight"""
+    queue = asyncio.Queue()
+    for request in requests:
+        queue.put_nowait(request)
+    samples = []
+
+    async def worker():
+        while True:
+            try:
+                endpoint, size, path, body = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            start = time.perf_counter()
+            try:
+                response = await client.post(path, json=body)
+                ok = response.status_code == 200
+            except httpx.HTTPError:
+                ok = False
+            samples.append({
+                'endpoint': endpoint,
+                'size': size,
+                'ok': ok,
+                'latency': time.perf_counter() - start,
+            })
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return samples, time.perf_counter() - start
+
+
+def make_client(url, timeout):
+    if url:
+        return httpx.AsyncClient(base_url=url, timeout=timeout)
+    from backend.main import app
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app),
+                             base_url="http://loadtest", timeout=timeout)
+
+
+def format_row(name, stats):
+    def ms(value):
+        return f"{value:>9.1f}" if value is not None else f"{'-':>9}"
+    return (f"{name:<22} {stats['requests']:>8} {stats['throughput']:>9.1f} "
+            f"{ms(stats['p50_ms'])} {ms(stats['p95_ms'])} {ms(stats['p99_ms'])} {stats['error_rate']:>7.1%}")
+
+
+HEADER = f"{'':<22} {'requests':>8} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}"
+
+
+def report(path):
+    """Print the overall line of every run saved in a JSON lines file"""
+    print(HEADER)
+    with open(path, encoding='utf-8') as saved:
+        for line in saved:
+            run = json.loads(line)
+            print(format_row(run['label'] or run['target'], run['overall']))
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--url", help="base URL of a running server (default: in-process ASGI)")
+    arg_parser.add_argument("--requests", type=int, default=100)
+    arg_parser.add_argument("--concurrency", type=int, default=4)
+    arg_parser.add_argument("--endpoints", default="compare:3,semantic:1",
+                            type=lambda text: parse_mix(text, ENDPOINTS))
+    arg_parser.add_argument("--sizes", default="small:6,medium:3,large:1",
+                            type=lambda text: parse_mix(text, SIZES))
+    arg_parser.add_argument("--timeout", type=float, default=60.0)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--label", default="", help="name for this run, e.g. workers=4")
+    arg_parser.add_argument("--save", help="append the results to this JSON lines file")
+    arg_parser.add_argument("--report", help="print the runs saved in this file and exit")
+    args = arg_parser.parse_args()
+
+    if args.report:
+        report(args.report)
+        return 0
+
+    rng = random.Random(args.seed)
+    requests = [make_request(rng, args.endpoints, args.sizes) for _ in range(args.requests)]
+
+    async def run():
+        async with make_client(args.url, args.timeout) as client:
+            return await run_load(client, requests, args.concurrency)
+
+    samples, elapsed = asyncio.run(run())
+
+    result = {
+        'label': args.label,
+        'target': args.url or 'in-process',
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'concurrency': args.concurrency,
+        'endpoints': args.endpoints,
+        'sizes': args.sizes,
+        'elapsed_s': elapsed,
+        'overall': summarize(samples, elapsed),
+        'by_endpoint': {},
+        'by_size': {},
+    }
+    for key, group in (('by_endpoint', 'endpoint'), ('by_size', 'size')):
+        for name in sorted({sample[group] for sample in samples}):
+            result[key][name] = summarize([s for s in samples if s[group] == name], elapsed)
+
+    print(f"{result['target']}: {args.requests} requests, concurrency {args.concurrency}, {elapsed:.2f} s")
+    print(HEADER)
+    print(format_row('overall', result['overall']))
+    for key in ('by_endpoint', 'by_size'):
+        for name, stats in result[key].items():
+            print(format_row(f"  {name}", stats))
+
+    if args.save:
+        with open(args.save, 'a', encoding='utf-8') as saved:
+            saved.write(json.dumps(result) + "\n")
+    return 1 if result['overall']['errors'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,17 @@
+"""Synthetic submissions shared by the benchmarks and the load test."""
+
+
+def make_submission(rng, statements=12):
+    """Random submission built from a few statement templates"""
+    names = rng.sample("abcdefghijklmnopqrstuvwxyz", 4)
+    lines = [f"int {name} = {rng.randint(0, 9)};" for name in names]
+    for _ in range(statements):
+        a, b = rng.sample(names, 2)
+        pick = rng.random()
+        if pick < 0.4:
+            lines.append(f"{a} = {a} + {b} * {rng.randint(1, 9)};")
+        elif pick < 0.7:
+            lines.append(f"while ({a} < {rng.randint(10, 99)}) {{ {a} = {a} + {b}; }}")
+        else:
+            lines.append(f"if ({a} > {b}) {{ {a} = {a} - 1; }} else {{ {b} = {b} + 1; }}")
+    return "\n".join(lines)
@@ -1,4 +1,6 @@
 import streamlit as st
+import html
+import importlib.util
 import sys
 import os
 
@@ -6,16 +8,15 @@ import os
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(current_dir)
 
-try:
-    import graphviz
-    GRAPHVIZ_AVAILABLE = True
-except ImportError:
-    GRAPHVIZ_AVAILABLE = False
+# Only check that graphviz is installed; it is imported on first use
+GRAPHVIZ_AVAILABLE = importlib.util.find_spec("graphviz") is not None
+if not GRAPHVIZ_AVAILABLE:
     st.warning("Graphviz not installed. Install with: pip install graphviz")
 
 try:
-    from backend.ast_compare import compare_code, calculate_similarity
+    from backend.incremental import IncrementalComparer
     from backend.parser import parse_code
+    from backend.traversal import preorder
     from backend.semantic import analyze_semantics  # Changed from semantic to semantics
 except ImportError as e:
     st.error(f"Import error: {e}")
@@ -27,6 +28,8 @@ def ast_to_graphviz(ast, graph_name="AST"):
     if not GRAPHVIZ_AVAILABLE:
         return None
     
+    import graphviz
+    
     if ast is None:
         dot = graphviz.Digraph(name=graph_name)
         dot.node('empty', 'Empty AST')
@@ -35,26 +38,28 @@ def ast_to_graphviz(ast, graph_name="AST"):
     dot = graphviz.Digraph(name=graph_name)
     dot.attr('node', shape='box')
     
-    def add_nodes_edges(node, parent_id=None):
-        if node is None:
-            return
-        
+    for node, parent in preorder(ast):
         node_id = str(id(node))
         label = str(node.type) if hasattr(node, 'type') else 'Unknown'
         if hasattr(node, 'value') and node.value is not None:
             label += f"\n{node.value}"
         dot.node(node_id, label)
         
-        if parent_id is not None:
-            dot.edge(parent_id, node_id)
-        
-        if hasattr(node, 'children'):
-            for child in node.children:
-                add_nodes_edges(child, node_id)
+        if parent is not None:
+            dot.edge(str(id(parent)), node_id)
     
-    add_nodes_edges(ast)
     return dot
 
+@st.cache_resource
+def get_incremental_comparer():
+    """Shared comparer so parsed statements and alignment costs survive reruns"""
+    return IncrementalComparer()
+
+@st.cache_resource(max_entries=64)
+def cached_comparison(code1, code2):
+    """Compare two snippets, reusing the result when the same pair comes back"""
+    return get_incremental_comparer().compare(code1, code2)
+
 def display_similarity_score(similarity):
     """Display similarity score with appropriate color coding"""
     col1, col2, col3 = st.columns([1, 2, 1])
@@ -73,6 +78,39 @@ def display_similarity_score(similarity):
     
     return similarity
 
+def highlight_lines(code, ranges):
+    """Render code as HTML with the given 1-based line ranges highlighted"""
+    marked = set()
+    for start, end in ranges:
+        if start is not None and end is not None:
+            marked.update(range(start, end + 1))
+    
+    rows = []
+    for number, line in enumerate(code.splitlines(), start=1):
+        style = "background-color: rgba(255, 75, 75, 0.25);" if number in marked else ""
+        rows.append(f'<span style="{style}">{number:>4}  {html.escape(line)}</span>')
+    return '<pre style="line-height: 1.4;">' + "\n".join(rows) + "</pre>"
+
+def display_clone_regions(code1, code2, clones):
+    """Show matching regions as a table and highlight them in both snippets"""
+    st.subheader("Matching Regions")
+    if not clones:
+        st.info("No matching regions found")
+        return
+    
+    st.table([{
+        'Lines (Snippet 1)': f"{clone['lines1'][0]}-{clone['lines1'][1]}",
+        'Lines (Snippet 2)': f"{clone['lines2'][0]}-{clone['lines2'][1]}",
+        'Size (nodes)': clone['size'],
+        'Clone Type': clone['type']
+    } for clone in clones])
+    
+    region_col1, region_col2 = st.columns(2)
+    with region_col1:
+        st.markdown(highlight_lines(code1, [clone['lines1'] for clone in clones]), unsafe_allow_html=True)
+    with region_col2:
+        st.markdown(highlight_lines(code2, [clone['lines2'] for clone in clones]), unsafe_allow_html=True)
+
 def main():
     st.set_page_config(layout="wide", page_title="Plagiarism Detector")
     st.title("🔍 Code Plagiarism Detector")
@@ -103,8 +141,8 @@ def main():
             
             with st.spinner("Analyzing code similarity..."):
                 try:
-                    # Parse and compare code
-                    result = compare_code(code1, code2)
+                    # Parse and compare code, re-parsing only edited statements
+                    result = cached_comparison(code1, code2)
                     
                     if 'error' in result:
                         st.error(f"Error: {result['error']}")
@@ -117,6 +155,9 @@ def main():
                     # Display similarity score
                     display_similarity_score(similarity)
                     
+                    # Highlight the copied parts in both snippets
+                    display_clone_regions(code1, code2, result['clones'])
+                    
                     # Display ASTs if graphviz is available
                     if GRAPHVIZ_AVAILABLE:
                         st.subheader("Abstract Syntax Trees")
@@ -221,6 +262,7 @@ def main():
         2. ASTs are normalized to handle variable name differences
         3. Tree edit distance is calculated between normalized ASTs
         4. Similarity score is computed based on structural differences
+        5. Matching subtrees are located by hashing and mapped back to line ranges
         """)
 
 if __name__ == "__main__":